@@ -56,6 +56,10 @@ def get_latest_date_from_parquet(parquet_file: Path) -> str | None:
     """
     Extract latest date from existing Parquet file for incremental append.
 
+    Reads the max from the row-group statistics in the file footer, so no data
+    pages are decoded. Falls back to scanning only the date column when any
+    row group lacks min/max statistics.
+
     Args:
         parquet_file: Path to existing Parquet file
 
@@ -66,16 +70,42 @@ def get_latest_date_from_parquet(parquet_file: Path) -> str | None:
         return None
 
     try:
-        import pyarrow.compute as pc
-        table = pq.read_table(parquet_file, columns=['date'])
-        # Use PyArrow compute instead of pandas for max date
-        max_date = pc.max(table['date']).as_py()
+        max_date = _max_date_from_statistics(parquet_file)
+        if max_date is None:
+            import pyarrow.compute as pc
+            table = pq.read_table(parquet_file, columns=['date'])
+            # Use PyArrow compute instead of pandas for max date
+            max_date = pc.max(table['date']).as_py()
         return max_date.strftime('%Y-%m-%d')
     except Exception as e:
         logging.warning(f"Could not read existing Parquet: {e}")
         return None
 
 
+def _max_date_from_statistics(parquet_file: Path):
+    """
+    Max of the date column from Parquet footer statistics (no data pages read).
+
+    Args:
+        parquet_file: Path to existing Parquet file
+
+    Returns:
+        Latest date as datetime.date, or None if any row group has no min/max
+        statistics for the date column (or the file has no row groups)
+    """
+    metadata = pq.read_metadata(parquet_file)
+    date_index = metadata.schema.to_arrow_schema().get_field_index('date')
+
+    row_group_maxes = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(date_index).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        row_group_maxes.append(stats.max)
+
+    return max(row_group_maxes, default=None)
+
+
 def generate_rankings_sql(start_date: str | None) -> str:
     """
     Generate SQL query for volume rankings with rank change tracking.
@@ -153,12 +183,17 @@ def generate_rankings_sql(start_date: str | None) -> str:
     """
 
 
-def query_rankings(db_path: Path, start_date: str | None, logger: logging.Logger | None = None) -> pa.Table:
+def query_rankings(
+    db: Path | duckdb.DuckDBPyConnection,
+    start_date: str | None,
+    logger: logging.Logger | None = None,
+) -> pa.Table:
     """
     Query database for volume rankings.
 
     Args:
-        db_path: Path to DuckDB database
+        db: Path to DuckDB database (opened read-only and closed afterwards), or an
+            open DuckDB connection (used as-is and left open for the caller)
         start_date: Optional start date for incremental append
         logger: Logger instance (optional, defaults to None for testing)
 
@@ -168,25 +203,32 @@ def query_rankings(db_path: Path, start_date: str | None, logger: logging.Logger
     Raises:
         RuntimeError: If database query fails
     """
-    if not db_path.exists():
-        raise RuntimeError(f"Database not found: {db_path}")
+    owns_conn = not isinstance(db, duckdb.DuckDBPyConnection)
+    if owns_conn and not db.exists():
+        raise RuntimeError(f"Database not found: {db}")
 
     try:
-        if logger:
-            logger.info(f"Connecting to database: {db_path}")
-        conn = duckdb.connect(str(db_path), read_only=True)
+        if owns_conn:
+            if logger:
+                logger.info(f"Connecting to database: {db}")
+            conn = duckdb.connect(str(db), read_only=True)
+        else:
+            conn = db
 
-        sql = generate_rankings_sql(start_date)
-        if logger:
-            logger.info(f"Querying rankings (start_date={start_date or 'all history'})")
+        try:
+            sql = generate_rankings_sql(start_date)
+            if logger:
+                logger.info(f"Querying rankings (start_date={start_date or 'all history'})")
 
-        # Execute query and convert to PyArrow
-        result = conn.execute(sql).fetch_arrow_table()
+            # Execute query and convert to PyArrow
+            result = conn.execute(sql).fetch_arrow_table()
+        finally:
+            if owns_conn:
+                conn.close()
 
         if logger:
             logger.info(f"Query returned {len(result):,} rows")
 
-        conn.close()
         return result
 
     except Exception as e:
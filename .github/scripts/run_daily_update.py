@@ -52,35 +52,46 @@ def main():
     try:
         # Initialize BatchProber
         logger.info('Initializing BatchProber with 150 workers')
-        prober = BatchProber(max_workers=150)
-
-        # Probe date range (uses existing probe_date_range method)
-        if lookback_days == 1:
-            # Optimize single-date case (backward compatibility)
-            logger.info(f'Probing single date: {yesterday}')
-            results = prober.probe_all_symbols(date=yesterday, contract_type="perpetual")
-        else:
-            # Multi-day lookback (ADR-0011)
-            logger.info(f'Probing date range: {start_date} to {yesterday}')
-            results = prober.probe_date_range(
-                start_date=start_date,
-                end_date=yesterday,
-                contract_type="perpetual"
-            )
-
-        # Insert results into database (UPSERT semantics handle duplicates)
-        logger.info(f'Inserting {len(results)} probe results into database')
-        db = AvailabilityDatabase(db_path=Path(db_path))
-        db.insert_batch(results)
-        db.close()
+        with BatchProber(max_workers=150) as prober:
+            db = AvailabilityDatabase(db_path=Path(db_path))
+
+            if lookback_days == 1:
+                # Optimize single-date case (backward compatibility)
+                logger.info(f'Probing single date: {yesterday}')
+                results = prober.probe_all_symbols(date=yesterday, contract_type="perpetual")
+
+                # Insert results into database (UPSERT semantics handle duplicates)
+                logger.info(f'Inserting {len(results)} probe results into database')
+                db.insert_batch(results)
+                total_count = len(results)
+                available_count = sum(1 for r in results if r["available"])
+            else:
+                # Multi-day lookback (ADR-0011): stream each date's results into the
+                # database as it completes instead of holding the whole window in memory
+                logger.info(f'Probing date range: {start_date} to {yesterday}')
+                available_count = 0
+
+                def stream_results():
+                    nonlocal available_count
+                    for date, date_results in prober.iter_date_range(
+                        start_date=start_date,
+                        end_date=yesterday,
+                        contract_type="perpetual"
+                    ):
+                        logger.info(f'Inserting {len(date_results)} probe results for {date}')
+                        available_count += sum(1 for r in date_results if r["available"])
+                        yield from date_results
+
+                total_count = db.upsert_stream(stream_results())
+
+            db.close()
 
         # Log summary
-        available_count = sum(1 for r in results if r["available"])
-        unavailable_count = len(results) - available_count
+        unavailable_count = total_count - available_count
 
         logger.info(
             f'Daily update completed successfully: '
-            f'{len(results)} total records, '
+            f'{total_count} total records, '
             f'{available_count} available, '
             f'{unavailable_count} unavailable, '
             f'Date range: {start_date} to {yesterday}'
@@ -110,8 +110,10 @@ def run_single_trial(
 
         # 1. PROBE PHASE (HTTP requests)
         probe_start = time.perf_counter()
-        prober = BatchProber(max_workers=worker_count)
-        results = prober.probe_all_symbols(date=test_date, symbols=symbols)
+        # Pool is shut down per trial (included in probe time, as when each call owned
+        # its pool) so idle worker threads do not pile up across trials and inflate RSS
+        with BatchProber(max_workers=worker_count) as prober:
+            results = prober.probe_all_symbols(date=test_date, symbols=symbols)
         probe_end = time.perf_counter()
         probe_time = probe_end - probe_start
 
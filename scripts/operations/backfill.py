@@ -114,7 +114,7 @@ def backfill_symbol(
 
             current_date += datetime.timedelta(days=1)
 
-        # Bulk insert into database (uses INSERT OR REPLACE for UPSERT)
+        # Bulk insert into database (UPSERT via INSERT ... ON CONFLICT DO UPDATE)
         db.insert_batch(records)
 
         result = {
@@ -144,11 +144,12 @@ def main() -> int:
         logger.warning("Note: Symbols retained in list (ADR-0010: never remove, probe forever)")
         logger.info("")
 
-    # Update metadata
+    # Update metadata (one clock read so both fields describe the same instant)
+    now = datetime.now(UTC)
     updated = {
         "metadata": {
-            "discovery_date": datetime.now(UTC).strftime("%Y-%m-%d"),
-            "last_discovery": datetime.now(UTC).isoformat(),
+            "discovery_date": now.strftime("%Y-%m-%d"),
+            "last_discovery": now.isoformat(),
             "source": "S3 Vision bucket: s3://data.binance.vision/data/futures/um/daily/klines/",
             "discovery_method": "S3 XML API",
             "note": "Symbols with historical data availability on S3 Vision (auto-updated daily)",
@@ -1,13 +1,109 @@
 """Core database operations for availability storage."""
 
 import datetime
+from collections.abc import Iterable
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import duckdb
+import pyarrow as pa
 
 from binance_futures_availability.database.schema import create_schema
 
+# Arrow types for daily_availability columns (schema.py), in schema order. This is
+# the single column list of the write path: INSERT_COLUMNS, VALUE_COLUMNS and
+# TUPLE_SCHEMA are derived from it by name. Python records are converted to one
+# columnar batch with this schema and UPSERTed with a single INSERT ... SELECT:
+# DuckDB's executemany re-executes its statement per row.
+# Timezone-aware datetimes are normalized to UTC (TIMESTAMP columns store UTC).
+ARROW_SCHEMA = pa.schema(
+    [
+        ("date", pa.date32()),
+        ("symbol", pa.string()),
+        ("available", pa.bool_()),
+        ("file_size_bytes", pa.int64()),
+        ("last_modified", pa.timestamp("us")),
+        ("url", pa.string()),
+        ("status_code", pa.int32()),
+        ("probe_timestamp", pa.timestamp("us")),
+        # ADR-0007: Volume metrics (all nullable)
+        ("quote_volume_usdt", pa.float64()),
+        ("trade_count", pa.int64()),
+        ("volume_base", pa.float64()),
+        ("taker_buy_volume_base", pa.float64()),
+        ("taker_buy_quote_volume_usdt", pa.float64()),
+        ("open_price", pa.float64()),
+        ("high_price", pa.float64()),
+        ("low_price", pa.float64()),
+        ("close_price", pa.float64()),
+    ]
+)
+
+# Primary key order of daily_availability. UPSERT payloads are sorted on it so
+# index lookups walk the ART in key order instead of hopping randomly
+# (unsorted UPSERT batches degrade super-linearly on large tables).
+PRIMARY_KEY = ("date", "symbol")
+
+# Explicit INSERT column list: never relies on the table's physical column order
+INSERT_COLUMNS = tuple(ARROW_SCHEMA.names)
+
+# Non-key columns in schema order (ADR-0007 volume metrics last, all nullable)
+VALUE_COLUMNS = tuple(column for column in INSERT_COLUMNS if column not in PRIMARY_KEY)
+
+# Positional layout accepted by insert_batch_tuples(): the probe result fields,
+# without the ADR-0007 volume metrics
+TUPLE_SCHEMA = pa.schema(
+    [
+        ARROW_SCHEMA.field(name)
+        for name in (
+            *PRIMARY_KEY,
+            "available",
+            "file_size_bytes",
+            "last_modified",
+            "url",
+            "status_code",
+            "probe_timestamp",
+        )
+    ]
+)
+
+# UPSERT conflict clause: update the existing row in place instead of the
+# delete + re-insert that INSERT OR REPLACE performs. Columns not supplied by
+# the INSERT are overwritten with NULL, matching the previous REPLACE semantics.
+# The WHERE guard skips the write when nothing but probe_timestamp would change:
+# re-probing a lookback window mostly re-observes immutable S3 files, so those
+# rows keep the timestamp of the probe that last changed them.
+ON_CONFLICT_UPDATE = (
+    "ON CONFLICT (date, symbol) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in VALUE_COLUMNS)
+    + " WHERE "
+    + " OR ".join(
+        f"daily_availability.{column} IS DISTINCT FROM excluded.{column}"
+        for column in VALUE_COLUMNS
+        if column != "probe_timestamp"
+    )
+)
+
+
+def _utc_naive(value: Any) -> Any:
+    """Return a timezone-aware datetime as naive UTC (any other value unchanged)."""
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.astimezone(datetime.UTC).replace(tzinfo=None)
+    return value
+
+
+def _column_array(values: list[Any], field: pa.Field) -> pa.Array:
+    """Convert one column of record values to Arrow, as text if they don't fit its type."""
+    try:
+        return pa.array(values, type=field.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed or foreign value types (e.g. ISO strings beside date objects): DuckDB
+        # casts the text on INSERT, as per-row parameter binding did
+        return pa.array(
+            [None if value is None else str(_utc_naive(value)) for value in values], pa.string()
+        )
+
 
 class AvailabilityDatabase:
     """
@@ -20,13 +116,14 @@ class AvailabilityDatabase:
     """
 
     def __init__(
-        self, db_path: Path | None = None, skip_materialized_refresh: bool = False
+        self, db_path: Path | str | None = None, skip_materialized_refresh: bool = False
     ) -> None:
         """
         Initialize database connection and create schema if needed.
 
         Args:
-            db_path: Custom database path (default: DB_PATH env var or ~/.cache/binance-futures/availability.duckdb)
+            db_path: Custom database path (default: DB_PATH env var or ~/.cache/binance-futures/availability.duckdb),
+                     or ":memory:" for a private in-memory database (no disk I/O; gone on close)
             skip_materialized_refresh: Skip auto-refresh of materialized views after batch insert (for parallel operations)
         """
         if db_path is None:
@@ -93,22 +190,20 @@ class AvailabilityDatabase:
         """
         try:
             self.conn.execute(
-                """
-                INSERT OR REPLACE INTO daily_availability
-                (date, symbol, available, file_size_bytes, last_modified, url, status_code, probe_timestamp,
-                 quote_volume_usdt, trade_count, volume_base, taker_buy_volume_base,
-                 taker_buy_quote_volume_usdt, open_price, high_price, low_price, close_price)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                f"""
+                INSERT INTO daily_availability ({", ".join(INSERT_COLUMNS)})
+                VALUES ({", ".join("?" * len(INSERT_COLUMNS))})
+                {ON_CONFLICT_UPDATE}
                 """,
                 [
                     date,
                     symbol,
                     available,
                     file_size_bytes,
-                    last_modified,
+                    _utc_naive(last_modified),
                     url,
                     status_code,
-                    probe_timestamp,
+                    _utc_naive(probe_timestamp),
                     quote_volume_usdt,
                     trade_count,
                     volume_base,
@@ -123,13 +218,18 @@ class AvailabilityDatabase:
         except Exception as e:
             raise RuntimeError(f"Failed to insert availability for {symbol} on {date}: {e}") from e
 
-    def insert_batch(self, records: list[dict[str, Any]]) -> None:
+    def insert_batch(self, records: list[dict[str, Any]] | pa.Table | pa.RecordBatch) -> None:
         """
         Insert multiple availability records in a single transaction.
 
         Args:
             records: List of dicts with keys matching insert_availability() parameters
-                     (8 required fields + 9 optional ADR-0007 volume fields)
+                     (8 required fields + 9 optional ADR-0007 volume fields), or a
+                     PyArrow Table/RecordBatch with columns named after the schema
+                     (columnar fast path: one INSERT ... SELECT, no per-row binding).
+                     Dict values DuckDB can cast to the column type are accepted
+                     (e.g. an ISO date string). If a (date, symbol) appears more
+                     than once, the last record wins.
 
         Raises:
             RuntimeError: On database error (ADR-0003: strict raise policy)
@@ -153,42 +253,14 @@ class AvailabilityDatabase:
             ... ]
             >>> db.insert_batch(records)
         """
-        if not records:
+        if len(records) == 0:
             return
 
         try:
-            self.conn.executemany(
-                """
-                INSERT OR REPLACE INTO daily_availability
-                (date, symbol, available, file_size_bytes, last_modified, url, status_code, probe_timestamp,
-                 quote_volume_usdt, trade_count, volume_base, taker_buy_volume_base,
-                 taker_buy_quote_volume_usdt, open_price, high_price, low_price, close_price)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    (
-                        r["date"],
-                        r["symbol"],
-                        r["available"],
-                        r.get("file_size_bytes"),
-                        r.get("last_modified"),
-                        r["url"],
-                        r["status_code"],
-                        r["probe_timestamp"],
-                        # ADR-0007: Volume metrics (all nullable)
-                        r.get("quote_volume_usdt"),
-                        r.get("trade_count"),
-                        r.get("volume_base"),
-                        r.get("taker_buy_volume_base"),
-                        r.get("taker_buy_quote_volume_usdt"),
-                        r.get("open_price"),
-                        r.get("high_price"),
-                        r.get("low_price"),
-                        r.get("close_price"),
-                    )
-                    for r in records
-                ],
-            )
+            if isinstance(records, pa.Table | pa.RecordBatch):
+                self._insert_arrow(records)
+            else:
+                self._insert_dicts(records)
             # ADR-0019: Auto-refresh materialized views after batch insert
             # Skip if disabled (for parallel operations to avoid concurrent conflicts)
             if not self.skip_materialized_refresh:
@@ -196,6 +268,143 @@ class AvailabilityDatabase:
         except Exception as e:
             raise RuntimeError(f"Failed to insert batch of {len(records)} records: {e}") from e
 
+    def _insert_arrow(self, batch: pa.Table | pa.RecordBatch) -> None:
+        """
+        UPSERT an Arrow batch with a single columnar INSERT ... SELECT (matched by column name).
+
+        When the batch holds the same (date, symbol) more than once, the last row
+        wins, as it did when rows were written one statement at a time.
+        """
+        # Input position of each row: QUALIFY keeps the last occurrence of a key
+        # (a single ON CONFLICT statement would otherwise keep the first)
+        batch = pa.Table.from_batches([batch]) if isinstance(batch, pa.RecordBatch) else batch
+        # Timezone-aware columns are cast to naive UTC here: DuckDB would convert them
+        # with the session TimeZone, so the stored value would depend on the process TZ
+        for index, field in enumerate(batch.schema):
+            if pa.types.is_timestamp(field.type) and field.type.tz is not None:
+                batch = batch.set_column(
+                    index, field.name, batch.column(index).cast(pa.timestamp(field.type.unit))
+                )
+        batch = batch.append_column(
+            "_input_ordinal", pa.array(range(batch.num_rows), type=pa.int64())
+        )
+        # Columns absent from the batch (e.g. volume metrics) are selected as NULL so the
+        # conflict clause can reference every column
+        select_list = ", ".join(
+            column if column in batch.schema.names else f"NULL AS {column}"
+            for column in INSERT_COLUMNS
+        )
+        self.conn.register("_arrow_batch", batch)
+        try:
+            self.conn.execute(
+                f"INSERT INTO daily_availability ({', '.join(INSERT_COLUMNS)}) "
+                f"SELECT {select_list} FROM _arrow_batch "
+                "QUALIFY row_number() OVER "
+                "(PARTITION BY date, symbol ORDER BY _input_ordinal DESC) = 1 "
+                f"ORDER BY date, symbol {ON_CONFLICT_UPDATE}"
+            )
+        finally:
+            self.conn.unregister("_arrow_batch")
+
+    def _insert_dicts(self, records: list[dict[str, Any]]) -> None:
+        """UPSERT record dicts as one Arrow batch (missing optional keys become NULL)."""
+        try:
+            batch = pa.Table.from_pylist(records, schema=ARROW_SCHEMA)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Values of another type than the column (e.g. "2024-01-15" for DATE, "100" for
+            # BIGINT): build every schema column from all records, so optional keys missing
+            # from the first record are kept
+            batch = pa.table(
+                {
+                    field.name: _column_array([record.get(field.name) for record in records], field)
+                    for field in ARROW_SCHEMA
+                }
+            )
+        self._insert_arrow(batch)
+
+    def insert_batch_tuples(self, rows: list[tuple]) -> None:
+        """
+        Insert multiple availability records given as positional tuples.
+
+        Fast path for callers that already hold rows in column order: columns are
+        transposed straight into Arrow arrays, skipping the per-field dict lookups
+        that insert_batch() performs for every record. ADR-0007 volume columns are
+        left NULL.
+
+        Args:
+            rows: Tuples of (date, symbol, available, file_size_bytes, last_modified,
+                  url, status_code, probe_timestamp)
+
+        Raises:
+            RuntimeError: On database error (ADR-0003: strict raise policy)
+
+        Example:
+            >>> db.insert_batch_tuples([
+            ...     (datetime.date(2024, 1, 15), 'BTCUSDT', True, 8421945, None,
+            ...      'https://data.binance.vision/...', 200, probe_timestamp),
+            ... ])
+        """
+        if not rows:
+            return
+
+        try:
+            self._insert_arrow(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(column, type=field.type)
+                        for column, field in zip(zip(*rows, strict=True), TUPLE_SCHEMA, strict=True)
+                    ],
+                    schema=TUPLE_SCHEMA,
+                )
+            )
+            # ADR-0019: Auto-refresh materialized views (same policy as insert_batch)
+            if not self.skip_materialized_refresh:
+                self.refresh_materialized_views()
+        except Exception as e:
+            raise RuntimeError(f"Failed to insert batch of {len(rows)} records: {e}") from e
+
+    def upsert_stream(self, records: Iterable[dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        UPSERT records from an iterable in fixed-size batches.
+
+        Consumes the iterable lazily, so only one batch of records is held in
+        memory at a time (e.g. a generator over BatchProber.iter_date_range()).
+        Materialized views are refreshed once, after the last batch.
+
+        Args:
+            records: Iterable of dicts with the same keys as insert_batch()
+            batch_size: Records per INSERT statement (default: 1000)
+
+        Returns:
+            Total number of records written
+
+        Raises:
+            RuntimeError: On database error (ADR-0003: strict raise policy)
+
+        Example:
+            >>> prober = BatchProber()
+            >>> db.upsert_stream(
+            ...     r
+            ...     for _, results in prober.iter_date_range(start, end)
+            ...     for r in results
+            ... )
+            14160
+        """
+        written = 0
+        iterator = iter(records)
+
+        try:
+            while batch := list(islice(iterator, batch_size)):
+                self._insert_dicts(batch)
+                written += len(batch)
+            # ADR-0019: Auto-refresh materialized views (same policy as insert_batch)
+            if written and not self.skip_materialized_refresh:
+                self.refresh_materialized_views()
+        except Exception as e:
+            raise RuntimeError(f"Failed to stream records after {written} written: {e}") from e
+
+        return written
+
     def query(self, sql: str, params: list[Any] | None = None) -> list[tuple]:
         """
         Execute arbitrary SQL query.
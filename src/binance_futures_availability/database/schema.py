@@ -74,6 +74,8 @@ def create_schema(conn: duckdb.DuckDBPyConnection) -> None:
             last_modified TIMESTAMP,
             url VARCHAR NOT NULL USING COMPRESSION dictionary,
             status_code INTEGER NOT NULL USING COMPRESSION bitpacking,
+            -- Probe that last changed the row's content: the UPSERT skips rows whose
+            -- other columns are unchanged, so identical re-probes keep the old value
             probe_timestamp TIMESTAMP NOT NULL,
 
             -- ADR-0007: Trading volume metrics (2025-11-24)
@@ -8,7 +8,8 @@ from __future__ import annotations
 import datetime
 import logging
 import socket  # ADR-0019: DNS cache warming
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
 
 from binance_futures_availability.probing.s3_vision import ProbeResult, check_symbol_availability
@@ -20,6 +21,13 @@ logger = logging.getLogger(__name__)
 BINANCE_VISION_HOSTNAME = "data.binance.vision"
 
 
+def _date_range(start_date: datetime.date, end_date: datetime.date) -> list[datetime.date]:
+    """Return every date from start_date to end_date inclusive (empty if start > end)."""
+    return [
+        start_date + datetime.timedelta(days=i) for i in range((end_date - start_date).days + 1)
+    ]
+
+
 class BatchProber:
     """
     Parallel batch probing of futures availability.
@@ -27,6 +35,9 @@ class BatchProber:
     Uses ThreadPoolExecutor for concurrent HTTP HEAD requests.
     Conservative rate limiting to avoid S3 throttling.
 
+    The worker pool is created on first use and reused across calls; release
+    it with shutdown() or by using the prober as a context manager.
+
     See: docs/architecture/decisions/0003-error-handling-strict-policy.md
     """
 
@@ -45,6 +56,31 @@ class BatchProber:
         """
         self.max_workers = max_workers
         self.rate_limit = rate_limit
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker pool, cancelling queued probes (safe to call repeatedly).
+
+        The prober stays usable: the next probe call starts a fresh pool.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit (shuts down the worker pool)."""
+        self.shutdown()
 
     def _warm_dns_cache(self) -> None:
         """
@@ -96,38 +132,54 @@ class BatchProber:
         # ADR-0019: Warm DNS cache before parallel probes (3% performance improvement)
         self._warm_dns_cache()
 
+        executor = self._get_executor()
+        # Submit all tasks
+        future_to_symbol = {
+            executor.submit(check_symbol_availability, symbol, date): symbol for symbol in symbols
+        }
+        return self._collect_results(date, future_to_symbol)
+
+    def _collect_results(
+        self, date: datetime.date, future_to_symbol: dict[Future, str]
+    ) -> list[dict[str, Any]]:
+        """
+        Wait for one date's probe futures and gather their results.
+
+        Args:
+            date: Trading date the futures were submitted for
+            future_to_symbol: Mapping of submitted futures to their symbol
+
+        Returns:
+            List of probe result dicts for the date
+
+        Raises:
+            RuntimeError: If any probe failed (ADR-0003: strict raise policy)
+        """
         results = []
         failed = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_symbol = {
-                executor.submit(check_symbol_availability, symbol, date): symbol
-                for symbol in symbols
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_symbol):
-                symbol = future_to_symbol[future]
-                try:
-                    result: ProbeResult = future.result()
-                    results.append(result)
+        # Collect results as they complete
+        for future in as_completed(future_to_symbol):
+            symbol = future_to_symbol[future]
+            try:
+                result: ProbeResult = future.result()
+                results.append(result)
 
-                    if result["available"]:
-                        logger.debug(f"✓ {symbol}: available ({result['file_size_bytes']} bytes)")
-                    else:
-                        logger.debug(f"✗ {symbol}: not available (404)")
+                if result["available"]:
+                    logger.debug(f"✓ {symbol}: available ({result['file_size_bytes']} bytes)")
+                else:
+                    logger.debug(f"✗ {symbol}: not available (404)")
 
-                except Exception as e:
-                    # Log failure but continue collecting (ADR-0003: raise at end)
-                    logger.error(f"Probe failed for {symbol} on {date}: {e}")
-                    failed.append((symbol, str(e)))
+            except Exception as e:
+                # Log failure but continue collecting (ADR-0003: raise at end)
+                logger.error(f"Probe failed for {symbol} on {date}: {e}")
+                failed.append((symbol, str(e)))
 
         # Raise if any failures occurred (ADR-0003: strict policy)
         if failed:
             error_summary = "\n".join(f"  - {sym}: {err}" for sym, err in failed)
             raise RuntimeError(
-                f"Batch probe failed for {len(failed)}/{len(symbols)} symbols on {date}:\n"
+                f"Batch probe failed for {len(failed)}/{len(future_to_symbol)} symbols on {date}:\n"
                 f"{error_summary}"
             )
 
@@ -147,7 +199,10 @@ class BatchProber:
         checkpoint_callback: callable | None = None,
     ) -> list[dict[str, Any]]:
         """
-        Probe multiple dates sequentially.
+        Probe multiple dates and return all results as one list.
+
+        Thin wrapper over iter_date_range(); use that directly (e.g. with
+        AvailabilityDatabase.upsert_stream) to avoid holding every result.
 
         Args:
             start_date: Range start (inclusive)
@@ -172,30 +227,88 @@ class BatchProber:
             4956  # 7 days × 708 symbols
         """
         all_results = []
-        current_date = start_date
 
-        while current_date <= end_date:
-            logger.info(f"Probing date: {current_date}")
+        for date, date_results in self.iter_date_range(
+            start_date, end_date, symbols=symbols, contract_type=contract_type
+        ):
+            all_results.extend(date_results)
 
-            try:
-                date_results = self.probe_all_symbols(
-                    date=current_date, symbols=symbols, contract_type=contract_type
-                )
-                all_results.extend(date_results)
+            # Checkpoint callback (for progress tracking)
+            if checkpoint_callback:
+                checkpoint_callback(date, date_results)
 
-                # Checkpoint callback (for progress tracking)
-                if checkpoint_callback:
-                    checkpoint_callback(current_date, date_results)
+        logger.info(
+            f"Date range probe completed: {len(all_results)} total results "
+            f"({start_date} to {end_date})"
+        )
 
-            except RuntimeError as e:
-                # Re-raise with date context
-                raise RuntimeError(f"Probe failed for {current_date}: {e}") from e
+        return all_results
 
-            current_date += datetime.timedelta(days=1)
+    def iter_date_range(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        symbols: list[str] | None = None,
+        contract_type: str = "perpetual",
+    ) -> Iterator[tuple[datetime.date, list[dict[str, Any]]]]:
+        """
+        Probe multiple dates with a single shared worker pool, yielding per date.
+
+        Every (date, symbol) pair is submitted up front, so workers stay busy
+        across date boundaries instead of draining at the end of each date.
+        Results are yielded date by date, in order, and released once yielded.
+
+        Args:
+            start_date: Range start (inclusive)
+            end_date: Range end (inclusive)
+            symbols: Custom symbol list (default: load from symbol_discovery)
+            contract_type: "perpetual", "delivery", or "all" (if symbols=None)
+
+        Yields:
+            (date, probe results for that date)
+
+        Raises:
+            RuntimeError: On any probe failure (ADR-0003: strict raise policy)
+        """
+        if symbols is None:
+            symbols = load_discovered_symbols(contract_type=contract_type)  # type: ignore
+
+        dates = _date_range(start_date, end_date)
 
         logger.info(
-            f"Date range probe completed: {len(all_results)} total results "
+            f"Starting date range probe: {len(dates)} dates × {len(symbols)} symbols "
             f"({start_date} to {end_date})"
         )
 
-        return all_results
+        # ADR-0019: Warm DNS cache once for the whole range
+        self._warm_dns_cache()
+
+        executor = self._get_executor()
+        futures_by_date: dict[datetime.date, dict[Future, str]] = {}
+        try:
+            futures_by_date = {
+                date: {
+                    executor.submit(check_symbol_availability, symbol, date): symbol
+                    for symbol in symbols
+                }
+                for date in dates
+            }
+
+            for date in dates:
+                logger.info(f"Probing date: {date}")
+
+                # pop: drop the futures (and their results) once this date is consumed
+                future_to_symbol = futures_by_date.pop(date)
+                try:
+                    date_results = self._collect_results(date, future_to_symbol)
+                except RuntimeError as e:
+                    # Re-raise with date context
+                    raise RuntimeError(f"Probe failed for {date}: {e}") from e
+
+                yield date, date_results
+        finally:
+            # Drop still-queued probes if a date failed or the consumer stopped early
+            # (the pool itself is shared, so cancel this range's futures only)
+            for future_to_symbol in futures_by_date.values():
+                for future in future_to_symbol:
+                    future.cancel()
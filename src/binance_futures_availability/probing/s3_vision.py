@@ -6,20 +6,48 @@ See: docs/architecture/decisions/0019-performance-optimization-strategy.md (HTTP
 """
 
 import datetime
+import functools
 import urllib.parse
 from typing import TypedDict
 
 import urllib3  # ADR-0019: HTTP connection pooling
 
+# Keep-alive connections retained per host. Must cover BatchProber's worker count:
+# urllib3 closes (rather than keeps) connections returned to a full pool, so with
+# 150 workers and maxsize=10, ~140 probes per round paid a fresh TCP + TLS handshake.
+HTTP_POOL_MAXSIZE = 150
+
 # ADR-0019: Global HTTP connection pool (reuses SSL/TLS connections)
-# Default pool size: 10 connections, sufficient for parallel probing
 HTTP_POOL = urllib3.PoolManager(
     num_pools=1,  # Single pool for all requests
-    maxsize=10,  # Max connections per pool
+    maxsize=HTTP_POOL_MAXSIZE,  # Max connections per pool
     timeout=urllib3.Timeout(connect=5.0, read=10.0),  # Connect + read timeouts
     retries=False,  # ADR-0003: No automatic retries
 )
 
+S3_KLINES_URL = "https://data.binance.vision/data/futures/um/daily/klines"
+
+
+@functools.lru_cache(maxsize=4096)
+def _symbol_url_prefix(symbol: str) -> str:
+    """
+    Build the date-independent part of a symbol's 1m klines URL.
+
+    Cached per symbol: a date range probe requests the same few hundred
+    symbols for every date, so the percent-encoding is done once each.
+
+    Args:
+        symbol: Futures symbol (e.g., BTCUSDT, 币安人生USDT)
+
+    Returns:
+        URL prefix ending just before the date, e.g.
+        ".../klines/BTCUSDT/1m/BTCUSDT-1m-"
+    """
+    # URL-encode symbol to handle non-ASCII characters (e.g., 币安人生USDT)
+    # safe='' ensures all non-ASCII chars are percent-encoded
+    encoded_symbol = urllib.parse.quote(symbol, safe="")
+    return f"{S3_KLINES_URL}/{encoded_symbol}/1m/{encoded_symbol}-1m-"
+
 
 class ProbeResult(TypedDict):
     """Result of probing a single symbol on a specific date."""
@@ -34,6 +62,21 @@ class ProbeResult(TypedDict):
     probe_timestamp: datetime.datetime
 
 
+# Result skeleton copied per probe: dict.copy() reuses the shared key table and is
+# ~4x faster than ProbeResult(**kwargs). Fields left untouched keep these defaults
+# (e.g. file_size_bytes/last_modified stay None for a 404).
+_RESULT_TEMPLATE = ProbeResult(
+    symbol="",
+    date=datetime.date.min,
+    available=False,
+    file_size_bytes=None,
+    last_modified=None,
+    url="",
+    status_code=0,
+    probe_timestamp=datetime.datetime.min.replace(tzinfo=datetime.UTC),
+)
+
+
 def check_symbol_availability(symbol: str, date: datetime.date, timeout: int = 10) -> ProbeResult:
     """
     Check if a symbol's 1m klines file exists on Binance Vision S3.
@@ -62,16 +105,13 @@ def check_symbol_availability(symbol: str, date: datetime.date, timeout: int = 1
         https://data.binance.vision/data/futures/um/daily/klines/{symbol}/1m/{symbol}-1m-{YYYY-MM-DD}.zip
     """
     # Construct S3 Vision URL (with proper URL encoding for Unicode symbols)
-    date_str = date.strftime("%Y-%m-%d")
-    # URL-encode symbol to handle non-ASCII characters (e.g., 币安人生USDT)
-    # safe='' ensures all non-ASCII chars are percent-encoded
-    encoded_symbol = urllib.parse.quote(symbol, safe="")
-    url = (
-        f"https://data.binance.vision/data/futures/um/daily/klines/"
-        f"{encoded_symbol}/1m/{encoded_symbol}-1m-{date_str}.zip"
-    )
+    url = f"{_symbol_url_prefix(symbol)}{date.isoformat()}.zip"
 
-    probe_timestamp = datetime.datetime.now(datetime.UTC)
+    result = _RESULT_TEMPLATE.copy()
+    result["symbol"] = symbol
+    result["date"] = date
+    result["url"] = url
+    result["probe_timestamp"] = datetime.datetime.now(datetime.UTC)
 
     try:
         # ADR-0019: Use connection pool for HTTP HEAD request
@@ -79,7 +119,9 @@ def check_symbol_availability(symbol: str, date: datetime.date, timeout: int = 1
 
         if response.status == 200:
             # File exists (200 OK)
-            file_size = int(response.headers.get("Content-Length", 0))
+            # Missing Content-Length means size unknown (None), not an empty file
+            content_length = response.headers.get("Content-Length")
+            file_size = int(content_length) if content_length else None
             last_modified_str = response.headers.get("Last-Modified")
 
             # Parse Last-Modified header (RFC 2822 format)
@@ -92,29 +134,16 @@ def check_symbol_availability(symbol: str, date: datetime.date, timeout: int = 1
                 except Exception:
                     pass  # Skip parsing errors
 
-            return ProbeResult(
-                symbol=symbol,
-                date=date,
-                available=True,
-                file_size_bytes=file_size,
-                last_modified=last_modified,
-                url=url,
-                status_code=200,
-                probe_timestamp=probe_timestamp,
-            )
+            result["available"] = True
+            result["file_size_bytes"] = file_size
+            result["last_modified"] = last_modified
+            result["status_code"] = 200
+            return result
 
         if response.status == 404:
             # File not found (symbol not available on this date)
-            return ProbeResult(
-                symbol=symbol,
-                date=date,
-                available=False,
-                file_size_bytes=None,
-                last_modified=None,
-                url=url,
-                status_code=404,
-                probe_timestamp=probe_timestamp,
-            )
+            result["status_code"] = 404
+            return result
 
         # Other HTTP errors (403, 500, etc.) - raise immediately (ADR-0003)
         raise RuntimeError(f"S3 probe failed for {symbol} on {date}: HTTP {response.status}")
@@ -7,26 +7,34 @@ Test organization:
 Coverage target: 80%+ (pyproject.toml: --cov-fail-under=80)
 """
 
+import csv
 import datetime
-import tempfile
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
 from binance_futures_availability.database.availability_db import AvailabilityDatabase
+from binance_futures_availability.probing.batch_prober import BatchProber
+
+# Fixed probe timestamp: tests never assert on it, so avoid a clock read per record
+FIXED_TS = datetime.datetime(2024, 1, 16, 10, 0, 0, tzinfo=datetime.UTC)
 
 
 @pytest.fixture
-def temp_db_path() -> Path:
+def temp_db_path(tmp_path: Path) -> Path:
     """
     Create temporary database path for tests.
 
+    Lives under pytest's per-test tmp_path, so every test (and every xdist
+    worker) gets its own directory and pytest cleans it up.
+
     Returns:
         Path to temporary .duckdb file (file not created, only path)
     """
-    temp_dir = Path(tempfile.gettempdir())
-    return temp_dir / f"test_{tempfile.mktemp(suffix='.duckdb').split('/')[-1]}"
+    return tmp_path / "test.duckdb"
 
 
 @pytest.fixture
@@ -40,6 +48,30 @@ def db(temp_db_path: Path) -> AvailabilityDatabase:
     return AvailabilityDatabase(db_path=temp_db_path)
 
 
+@pytest.fixture(scope="session")
+def schema_db(tmp_path_factory: pytest.TempPathFactory) -> Iterator[AvailabilityDatabase]:
+    """
+    Session-wide database instance for read-only schema tests.
+
+    Schema creation (CREATE TABLE + indexes) runs once per session instead of
+    once per test. Tests using this fixture must not write to the database.
+
+    Returns:
+        AvailabilityDatabase instance with schema created
+    """
+    database = AvailabilityDatabase(db_path=tmp_path_factory.mktemp("schema") / "schema.duckdb")
+    yield database
+    database.close()
+
+
+# Sample dates shared by the sample records, the seed data and the tests asserting on them
+JAN15 = datetime.date(2024, 1, 15)
+JAN16 = datetime.date(2024, 1, 16)
+JAN17 = datetime.date(2024, 1, 17)
+JAN18 = datetime.date(2024, 1, 18)
+JAN19 = datetime.date(2024, 1, 19)
+
+
 @pytest.fixture
 def sample_probe_result() -> dict[str, Any]:
     """
@@ -50,7 +82,7 @@ def sample_probe_result() -> dict[str, Any]:
     """
     return {
         "symbol": "BTCUSDT",
-        "date": datetime.date(2024, 1, 15),
+        "date": JAN15,
         "available": True,
         "file_size_bytes": 8421945,
         "last_modified": datetime.datetime(2024, 1, 16, 2, 15, 32, tzinfo=datetime.UTC),
@@ -70,7 +102,7 @@ def sample_unavailable_result() -> dict[str, Any]:
     """
     return {
         "symbol": "NEWCOINUSDT",
-        "date": datetime.date(2024, 1, 15),
+        "date": JAN15,
         "available": False,
         "file_size_bytes": None,
         "last_modified": None,
@@ -80,74 +112,162 @@ def sample_unavailable_result() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def populated_db(db: AvailabilityDatabase) -> AvailabilityDatabase:
+# Columns written to the populated_db seed CSV (order matches the COPY column list)
+SEED_COLUMNS = (
+    "date",
+    "symbol",
+    "available",
+    "file_size_bytes",
+    "last_modified",
+    "url",
+    "status_code",
+    "probe_timestamp",
+)
+
+
+@pytest.fixture(scope="session")
+def seed_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    Database pre-populated with test data.
+    Seed data for populated_db, written once per session as CSV.
 
-    Inserts 3 days × 3 symbols = 9 records:
+    Contains 3 days × 3 symbols = 9 records:
         - 2024-01-15: BTCUSDT, ETHUSDT, SOLUSDT
         - 2024-01-16: BTCUSDT, ETHUSDT, SOLUSDT
         - 2024-01-17: BTCUSDT, ETHUSDT, SOLUSDT
 
     Returns:
-        Populated AvailabilityDatabase instance
+        Path to CSV file with header row (columns: SEED_COLUMNS)
     """
     symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
-    dates = [
-        datetime.date(2024, 1, 15),
-        datetime.date(2024, 1, 16),
-        datetime.date(2024, 1, 17),
-    ]
-
-    records = []
-    for date in dates:
-        for symbol in symbols:
-            records.append(
-                {
-                    "symbol": symbol,
-                    "date": date,
-                    "available": True,
-                    "file_size_bytes": 8000000 + len(symbol),
-                    "last_modified": datetime.datetime(
-                        date.year, date.month, date.day + 1, 2, 0, 0, tzinfo=datetime.UTC
-                    ),
-                    "url": f"https://data.binance.vision/data/futures/um/daily/klines/{symbol}/1m/{symbol}-1m-{date}.zip",
-                    "status_code": 200,
-                    "probe_timestamp": datetime.datetime.now(datetime.UTC),
-                }
-            )
-
-    db.insert_batch(records)
+    dates = [JAN15, JAN16, JAN17]
+    probe_timestamp = datetime.datetime(2024, 1, 18, 2, 0, 0, tzinfo=datetime.UTC)
+
+    csv_path = tmp_path_factory.mktemp("seed") / "daily_availability.csv"
+    with csv_path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SEED_COLUMNS)
+        for date in dates:
+            for symbol in symbols:
+                writer.writerow(
+                    [
+                        date,
+                        symbol,
+                        "true",
+                        8000000 + len(symbol),
+                        datetime.datetime(
+                            date.year, date.month, date.day + 1, 2, 0, 0, tzinfo=datetime.UTC
+                        ),
+                        f"https://data.binance.vision/data/futures/um/daily/klines/{symbol}/1m/{symbol}-1m-{date}.zip",
+                        200,
+                        probe_timestamp,
+                    ]
+                )
+
+    return csv_path
+
+
+def _load_seed(database: AvailabilityDatabase, seed_csv: Path) -> None:
+    """Bulk-load the seed CSV with a single COPY statement, then refresh views."""
+    database.conn.execute(
+        f"COPY daily_availability ({', '.join(SEED_COLUMNS)}) FROM '{seed_csv}' (HEADER)"
+    )
+    database.refresh_materialized_views()
+
+
+@pytest.fixture
+def populated_db(db: AvailabilityDatabase, seed_csv: Path) -> AvailabilityDatabase:
+    """
+    Database pre-populated with test data.
+
+    Bulk-loads the session seed CSV (3 days × 3 symbols = 9 records) with a
+    single COPY statement instead of per-record Python inserts.
+
+    Returns:
+        Populated AvailabilityDatabase instance
+    """
+    _load_seed(db, seed_csv)
     return db
 
 
+@pytest.fixture(scope="session")
+def populated_db_path(tmp_path_factory: pytest.TempPathFactory, seed_csv: Path) -> Path:
+    """
+    Session-wide database file with the populated_db seed data.
+
+    Built once per session for read-only query tests, which can share one
+    connection per module instead of opening the database in every test.
+    Tests using this fixture must not write to the database.
+
+    Returns:
+        Path to the seeded .duckdb file (connection already closed)
+    """
+    db_path = tmp_path_factory.mktemp("populated") / "populated.duckdb"
+    with AvailabilityDatabase(db_path=db_path) as database:
+        _load_seed(database, seed_csv)
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def shared_prober() -> Iterator[BatchProber]:
+    """
+    One BatchProber (10 workers) for the whole session.
+
+    Its worker pool is created on first use and reused by every test, then
+    shut down at session end.
+
+    Yields:
+        BatchProber with max_workers=10
+    """
+    with BatchProber(max_workers=10) as prober:
+        yield prober
+
+
+@pytest.fixture(scope="module")
+def mock_s3_response() -> Callable[..., SimpleNamespace]:
+    """
+    Factory for fake urllib3 HEAD responses, shared across a test module.
+
+    check_symbol_availability only reads .status and .headers, so a plain
+    namespace is enough (and far cheaper to build than a MagicMock per test).
+
+    Returns:
+        make(status=200, headers=None) -> response; headers default to a
+        Content-Length only (pass {} for a bare 404)
+    """
+
+    def make(status: int = 200, headers: dict[str, str] | None = None) -> SimpleNamespace:
+        if headers is None:
+            headers = {"Content-Length": "8000000"}
+        return SimpleNamespace(status=status, headers=headers)
+
+    return make
+
+
 @pytest.fixture
-def mock_urlopen_success(mocker):
+def mock_urlopen_success(mocker, mock_s3_response):
     """
     Mock urllib3.PoolManager.request for successful S3 HEAD request (200 OK).
 
     ADR-0019: Updated to mock urllib3 connection pooling
 
     Returns:
-        Mock object with status=200, headers
+        Mock of HTTP_POOL.request returning status=200 with headers
     """
-    mock_response = mocker.MagicMock()
-    mock_response.status = 200
-    mock_response.headers = {
-        "Content-Length": "8421945",
-        "Last-Modified": "Wed, 16 Jan 2024 02:15:32 GMT",
-    }
-
     # Mock urllib3.PoolManager.request() method
     return mocker.patch(
         "binance_futures_availability.probing.s3_vision.HTTP_POOL.request",
-        return_value=mock_response,
+        return_value=mock_s3_response(
+            200,
+            {
+                "Content-Length": "8421945",
+                "Last-Modified": "Wed, 16 Jan 2024 02:15:32 GMT",
+            },
+        ),
     )
 
 
 @pytest.fixture
-def mock_urlopen_404(mocker):
+def mock_urlopen_404(mocker, mock_s3_response):
     """
     Mock urllib3.PoolManager.request for 404 Not Found.
 
@@ -156,14 +276,10 @@ def mock_urlopen_404(mocker):
     Returns:
         Mock that returns response with status=404
     """
-    mock_response = mocker.MagicMock()
-    mock_response.status = 404
-    mock_response.headers = {}
-
     # Mock urllib3.PoolManager.request() to return 404 response
     return mocker.patch(
         "binance_futures_availability.probing.s3_vision.HTTP_POOL.request",
-        return_value=mock_response,
+        return_value=mock_s3_response(404, {}),
     )
 
 
@@ -16,6 +16,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from conftest import FIXED_TS
 
 from binance_futures_availability.database import AvailabilityDatabase
 
@@ -47,7 +48,7 @@ class TestGapDetectionLogic:
                 "last_modified": None,
                 "url": "https://example.com/BTCUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
             {
                 "symbol": "ETHUSDT",
@@ -57,7 +58,7 @@ class TestGapDetectionLogic:
                 "last_modified": None,
                 "url": "https://example.com/ETHUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
             {
                 "symbol": "SOLUSDT",
@@ -67,7 +68,7 @@ class TestGapDetectionLogic:
                 "last_modified": None,
                 "url": "https://example.com/SOLUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
         ]
         db.insert_batch(records)
@@ -120,7 +121,7 @@ class TestGapDetectionLogic:
                 "last_modified": None,
                 "url": "https://example.com/BTCUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
             {
                 "symbol": "ETHUSDT",
@@ -130,7 +131,7 @@ class TestGapDetectionLogic:
                 "last_modified": None,
                 "url": "https://example.com/ETHUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
             {
                 "symbol": "SOLUSDT",
@@ -140,7 +141,7 @@ class TestGapDetectionLogic:
                 "last_modified": None,
                 "url": "https://example.com/SOLUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
         ]
         db.insert_batch(records)
@@ -374,7 +375,7 @@ class TestIntegrationWithRealDatabase:
                 "last_modified": None,
                 "url": "https://example.com/BTCUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
             {
                 "symbol": "ETHUSDT",
@@ -384,7 +385,7 @@ class TestIntegrationWithRealDatabase:
                 "last_modified": None,
                 "url": "https://example.com/ETHUSDT",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             },
         ]
         db.insert_batch(records)
@@ -16,6 +16,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from conftest import FIXED_TS
 
 from binance_futures_availability.database import AvailabilityDatabase
 
@@ -31,13 +32,21 @@ class TestSymbolParsing:
         [
             # Primary use cases
             ("BTCUSDT,ETHUSDT,SOLUSDT", ["BTCUSDT", "ETHUSDT", "SOLUSDT"]),
+            ("BTCUSDT ETHUSDT SOLUSDT", ["BTCUSDT", "ETHUSDT", "SOLUSDT"]),
             ("BTCUSDT", ["BTCUSDT"]),
             # Edge cases
             ("BTCUSDT,  ETHUSDT  , SOLUSDT", ["BTCUSDT", "ETHUSDT", "SOLUSDT"]),
             ("BTCUSDT,ETHUSDT,", ["BTCUSDT", "ETHUSDT"]),
             ("", []),
         ],
-        ids=["comma-separated", "single", "whitespace", "trailing-comma", "empty"],
+        ids=[
+            "comma-separated",
+            "space-separated",
+            "single",
+            "whitespace",
+            "trailing-comma",
+            "empty",
+        ],
     )
     def test_symbol_parsing(self, symbols_arg: str, expected: list[str]):
         """Symbol parsing handles various input formats correctly."""
@@ -150,9 +159,9 @@ class TestBackfillWorkflow:
                 "available": True,
                 "file_size_bytes": 8000000,
                 "last_modified": None,
-                "url": "https://example.com/BTCUSDT",
+                "url": "",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             }
         ]
         db.insert_batch(existing_records)
@@ -165,18 +174,18 @@ class TestBackfillWorkflow:
                 "available": True,
                 "file_size_bytes": 7000000,
                 "last_modified": None,
-                "url": "https://example.com/NEW1USDT",
+                "url": "",
                 "status_code": 200,
-                "probe_timestamp": datetime.datetime.now(datetime.UTC),
+                "probe_timestamp": FIXED_TS,
             }
         ]
         db.insert_batch(new_symbol_records)
 
         # Verify database now contains both symbols
-        rows = db.query("SELECT DISTINCT symbol FROM daily_availability ORDER BY symbol")
-        symbols_in_db = [row[0] for row in rows]
+        rows = db.query("SELECT DISTINCT symbol FROM daily_availability")
+        symbols_in_db = {row[0] for row in rows}
 
-        assert symbols_in_db == ["BTCUSDT", "NEW1USDT"]
+        assert symbols_in_db == {"BTCUSDT", "NEW1USDT"}
         db.close()
 
     def test_multiple_symbols_backfill_workflow(self, tmp_path: Path):
@@ -188,49 +197,18 @@ class TestBackfillWorkflow:
         db_path = tmp_path / "multi_workflow_test.duckdb"
         db = AvailabilityDatabase(db_path=db_path)
 
-        # Insert existing symbol
-        db.insert_batch(
-            [
-                {
-                    "symbol": "BTCUSDT",
-                    "date": datetime.date(2024, 1, 15),
-                    "available": True,
-                    "file_size_bytes": 8000000,
-                    "last_modified": None,
-                    "url": "https://example.com/BTCUSDT",
-                    "status_code": 200,
-                    "probe_timestamp": datetime.datetime.now(datetime.UTC),
-                }
-            ]
-        )
-
-        # Backfill 3 new symbols
+        # Existing symbol + backfill of 3 new symbols, ingested in one round-trip
         new_symbols = ["NEW1USDT", "NEW2USDT", "NEW3USDT"]
-        for symbol in new_symbols:
-            db.insert_batch(
-                [
-                    {
-                        "symbol": symbol,
-                        "date": datetime.date(2024, 1, 15),
-                        "available": True,
-                        "file_size_bytes": 7000000,
-                        "last_modified": None,
-                        "url": f"https://example.com/{symbol}",
-                        "status_code": 200,
-                        "probe_timestamp": datetime.datetime.now(datetime.UTC),
-                    }
-                ]
-            )
+        date = datetime.date(2024, 1, 15)
+        rows = [(date, "BTCUSDT", True, 8000000, None, "", 200, FIXED_TS)]
+        rows += [(date, symbol, True, 7000000, None, "", 200, FIXED_TS) for symbol in new_symbols]
+        db.insert_batch_tuples(rows)
 
         # Verify all 4 symbols in database
-        rows = db.query("SELECT DISTINCT symbol FROM daily_availability ORDER BY symbol")
-        symbols_in_db = [row[0] for row in rows]
-
-        assert len(symbols_in_db) == 4
-        assert "BTCUSDT" in symbols_in_db
-        assert "NEW1USDT" in symbols_in_db
-        assert "NEW2USDT" in symbols_in_db
-        assert "NEW3USDT" in symbols_in_db
+        rows = db.query("SELECT DISTINCT symbol FROM daily_availability")
+        symbols_in_db = {row[0] for row in rows}
+
+        assert symbols_in_db == {"BTCUSDT", "NEW1USDT", "NEW2USDT", "NEW3USDT"}
         db.close()
 
 
@@ -8,54 +8,66 @@ Test coverage:
 See: docs/architecture/decisions/0027-test-suite-optimization.md
 """
 
+import re
 import subprocess
 import sys
 
+import pytest
+
+# Program name followed (anywhere later) by the command listing, compiled once
+_HELP_RE = re.compile(r"binance-futures-availability.*Available commands", re.DOTALL)
+
+
+def _run_cli(*args: str) -> subprocess.CompletedProcess:
+    """
+    Run the CLI entry point in a fresh interpreter and capture its output.
+
+    -I (isolated mode) skips user site-packages and PYTHON* env vars for a
+    faster, reproducible start. -S is not used: the package and its
+    dependencies are installed (editable via .pth) into site-packages.
+    """
+    return subprocess.run(
+        [sys.executable, "-I", "-m", "binance_futures_availability.cli.main", *args],
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def cli_help() -> subprocess.CompletedProcess:
+    """`--help` output, shared across tests (one interpreter start per session)."""
+    return _run_cli("--help")
+
+
+@pytest.fixture(scope="session")
+def cli_version() -> subprocess.CompletedProcess:
+    """`--version` output, shared across tests (one interpreter start per session)."""
+    return _run_cli("--version")
+
 
 class TestCLISmoke:
     """Smoke tests for CLI entry point."""
 
-    def test_help_flag_exits_zero(self):
+    def test_help_flag_exits_zero(self, cli_help):
         """--help should display help and exit 0."""
-        result = subprocess.run(
-            [sys.executable, "-m", "binance_futures_availability.cli.main", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "binance-futures-availability" in result.stdout
-        assert "Available commands" in result.stdout
+        assert cli_help.returncode == 0
+        assert _HELP_RE.search(cli_help.stdout)
 
-    def test_version_flag_exits_zero(self):
+    def test_version_flag_exits_zero(self, cli_version):
         """--version should display version and exit 0."""
-        result = subprocess.run(
-            [sys.executable, "-m", "binance_futures_availability.cli.main", "--version"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        assert "binance-futures-availability" in result.stdout
+        assert cli_version.returncode == 0
+        assert "binance-futures-availability" in cli_version.stdout
 
     def test_no_command_exits_nonzero(self):
         """No command should print help and exit 1."""
-        result = subprocess.run(
-            [sys.executable, "-m", "binance_futures_availability.cli.main"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run_cli()
 
         assert result.returncode == 1
         assert "binance-futures-availability" in result.stdout
 
     def test_query_help_exits_zero(self):
         """query --help should display query subcommands."""
-        result = subprocess.run(
-            [sys.executable, "-m", "binance_futures_availability.cli.main", "query", "--help"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run_cli("query", "--help")
 
         assert result.returncode == 0
         assert "snapshot" in result.stdout or "timeline" in result.stdout
@@ -1,6 +1,35 @@
 """Tests for AvailabilityDatabase CRUD operations."""
 
 import datetime
+import itertools
+
+import pyarrow as pa
+from conftest import FIXED_TS, JAN15, JAN16
+
+from binance_futures_availability.database.availability_db import (
+    TUPLE_SCHEMA,
+    AvailabilityDatabase,
+)
+
+
+def _build_probe_batch(
+    symbols: list[str], dates: list[datetime.date], file_size: int
+) -> pa.RecordBatch:
+    """Build a columnar (symbol × date) probe batch without per-row dicts."""
+    pairs = list(itertools.product(dates, symbols))
+    n = len(pairs)
+    return pa.RecordBatch.from_pydict(
+        {
+            "date": [d for d, _ in pairs],
+            "symbol": [s for _, s in pairs],
+            "available": [True] * n,
+            "file_size_bytes": [file_size] * n,
+            "last_modified": pa.nulls(n, pa.timestamp("us")),
+            "url": [""] * n,
+            "status_code": [200] * n,
+            "probe_timestamp": [FIXED_TS] * n,
+        }
+    )
 
 
 def test_insert_availability(db, sample_probe_result):
@@ -15,7 +44,7 @@ def test_insert_availability(db, sample_probe_result):
 
     assert len(result) == 1
     assert result[0][0] == "BTCUSDT"
-    assert result[0][1] == datetime.date(2024, 1, 15)
+    assert result[0][1] == JAN15
     assert result[0][2] is True
 
 
@@ -30,32 +59,221 @@ def test_insert_batch(db, sample_probe_result, sample_unavailable_result):
     assert result[0][0] == 2
 
 
+def test_insert_batch_tuples(db):
+    """Test positional-tuple batch insertion (fast path, no dict translation)."""
+    rows = [
+        (JAN15, "BTCUSDT", True, 8000000, None, "", 200, FIXED_TS),
+        (JAN15, "NEWCOINUSDT", False, None, None, "", 404, FIXED_TS),
+    ]
+
+    db.insert_batch_tuples(rows)
+
+    result = db.query(
+        "SELECT symbol, available, file_size_bytes FROM daily_availability ORDER BY symbol"
+    )
+    assert result == [("BTCUSDT", True, 8000000), ("NEWCOINUSDT", False, None)]
+
+
+def test_upsert_stream_batches_generator(db):
+    """Test streaming UPSERT: a generator is written across several batches."""
+    start = datetime.date(2024, 1, 1)
+    records = (
+        {
+            "date": start + datetime.timedelta(days=day),
+            "symbol": symbol,
+            "available": True,
+            "file_size_bytes": 8_000_000,
+            "last_modified": None,
+            "url": "",
+            "status_code": 200,
+            "probe_timestamp": FIXED_TS,
+        }
+        for day, symbol in itertools.product(range(5), ["BTCUSDT", "ETHUSDT"])
+    )
+
+    written = db.upsert_stream(records, batch_size=3)
+
+    assert written == 10
+    # Table and refreshed materialized view checked in one round-trip
+    result = db.query(
+        "SELECT (SELECT COUNT(*) FROM daily_availability), "
+        "(SELECT SUM(available_symbols) FROM daily_symbol_counts)"
+    )
+    assert result == [(10, 10)]
+
+
+def test_insert_batch_arrow_upsert_no_duplicates(db):
+    """Test Arrow fast path: re-inserting a 20-day window replaces rows, no duplicates."""
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    dates = [datetime.date(2024, 1, 1) + datetime.timedelta(days=i) for i in range(20)]
+
+    db.insert_batch(_build_probe_batch(symbols, dates, 8_000_000))
+    db.insert_batch(_build_probe_batch(symbols, dates, 9_000_000))
+
+    result = db.query(
+        "SELECT COUNT(*), MIN(file_size_bytes), MAX(file_size_bytes) FROM daily_availability"
+    )
+    assert result[0] == (60, 9_000_000, 9_000_000)
+
+
+def test_insert_batch_arrow_duplicate_keys_last_wins(db):
+    """Test Arrow fast path: a key repeated within one batch keeps its last row."""
+    first = _build_probe_batch(["BTCUSDT"], [JAN15], 8_000_000)
+    last = _build_probe_batch(["BTCUSDT"], [JAN15], 9_000_000)
+
+    db.insert_batch(pa.Table.from_batches([first, last]))
+
+    assert db.query("SELECT COUNT(*), MAX(file_size_bytes) FROM daily_availability") == [
+        (1, 9_000_000)
+    ]
+
+
+def test_insert_batch_duplicate_keys_last_wins(db, sample_probe_result, sample_unavailable_result):
+    """Test a (date, symbol) repeated within one dict batch keeps its last record."""
+    unavailable = {**sample_unavailable_result, "symbol": sample_probe_result["symbol"]}
+
+    db.insert_batch([unavailable, sample_probe_result])
+
+    assert db.query("SELECT available, status_code FROM daily_availability") == [(True, 200)]
+
+
+def test_insert_batch_casts_string_values(db, sample_probe_result):
+    """Test dict values DuckDB can cast (ISO date, numeric string) are still accepted."""
+    db.insert_batch([{**sample_probe_result, "date": "2024-01-15", "file_size_bytes": "100"}])
+
+    assert db.query("SELECT date, file_size_bytes FROM daily_availability") == [(JAN15, 100)]
+
+
+def test_insert_batch_cast_keeps_keys_missing_from_first_record(
+    db, sample_probe_result, sample_unavailable_result
+):
+    """Test the casting path keeps optional keys that only later records carry."""
+    first = {k: v for k, v in sample_probe_result.items() if k != "file_size_bytes"}
+    second = {**sample_unavailable_result, "file_size_bytes": 5, "quote_volume_usdt": 1.5}
+
+    db.insert_batch([{**first, "date": "2024-01-15"}, second])
+
+    result = db.query(
+        "SELECT symbol, file_size_bytes, quote_volume_usdt FROM daily_availability ORDER BY symbol"
+    )
+    assert result == [("BTCUSDT", None, None), ("NEWCOINUSDT", 5, 1.5)]
+
+
+def test_insert_batch_casts_mixed_date_column(db, sample_probe_result, sample_unavailable_result):
+    """Test a date column mixing date objects and ISO strings is accepted."""
+    db.insert_batch([sample_probe_result, {**sample_unavailable_result, "date": "2024-01-16"}])
+
+    result = db.query("SELECT date, symbol FROM daily_availability ORDER BY date")
+    assert result == [(JAN15, "BTCUSDT"), (JAN16, "NEWCOINUSDT")]
+
+
+def test_aware_timestamps_stored_as_utc_on_every_path(db, sample_probe_result):
+    """Test every write path stores the same UTC value under a non-UTC session TimeZone."""
+    db.conn.execute("SET TimeZone = 'Asia/Tokyo'")
+    record = {**sample_probe_result, "probe_timestamp": FIXED_TS}
+
+    db.insert_availability(**{**record, "symbol": "AAAUSDT"})
+    db.insert_batch([{**record, "symbol": "BBBUSDT"}])
+    tuple_record = {**record, "symbol": "CCCUSDT"}
+    db.insert_batch_tuples([tuple(tuple_record[name] for name in TUPLE_SCHEMA.names)])
+    db.insert_batch(pa.Table.from_pylist([{**record, "symbol": "DDDUSDT"}]))
+
+    result = db.query("SELECT DISTINCT last_modified, probe_timestamp FROM daily_availability")
+    # TIMESTAMP columns hold naive UTC
+    assert result == [(record["last_modified"].replace(tzinfo=None), FIXED_TS.replace(tzinfo=None))]
+
+
+def test_insert_batch_unsorted_records(db, sample_probe_result, sample_unavailable_result):
+    """Test insert_batch accepts records out of key order without mutating the caller's list."""
+    later = sample_probe_result.copy()
+    later["date"] = JAN16
+    records = [later, sample_unavailable_result, sample_probe_result]
+
+    db.insert_batch(records)
+
+    assert records[0] is later  # Caller's order untouched
+    result = db.query("SELECT date, symbol FROM daily_availability ORDER BY date, symbol")
+    assert result == [
+        (JAN15, "BTCUSDT"),
+        (JAN15, "NEWCOINUSDT"),
+        (JAN16, "BTCUSDT"),
+    ]
+
+
 def test_upsert_replaces_existing(db, sample_probe_result):
     """Test UPSERT behavior: insert then replace."""
-    # Insert initial record
-    db.insert_availability(**sample_probe_result)
-
-    # Modify and re-insert (should replace)
     modified = sample_probe_result.copy()
     modified["file_size_bytes"] = 9999999
 
+    # Insert then re-insert (should replace) inside one explicit transaction:
+    # a single commit, and UPSERT must behave the same as under auto-commit
+    db.conn.begin()
+    db.insert_availability(**sample_probe_result)
     db.insert_availability(**modified)
+    db.conn.commit()
 
-    # Verify only one record exists with updated value
+    # Verify only one record exists with updated value (count + value in one query)
     result = db.query(
-        "SELECT file_size_bytes FROM daily_availability WHERE symbol = ? AND date = ?",
+        "SELECT COUNT(*), MAX(file_size_bytes) FROM daily_availability WHERE symbol = ? AND date = ?",
         [sample_probe_result["symbol"], sample_probe_result["date"]],
     )
 
-    assert len(result) == 1
-    assert result[0][0] == 9999999
+    assert result[0] == (1, 9999999)
+
+
+def test_upsert_overwrites_omitted_columns(db, sample_probe_result):
+    """Test ON CONFLICT update keeps REPLACE semantics: omitted volume columns become NULL."""
+    db.insert_availability(**sample_probe_result, quote_volume_usdt=123456789.12)
+
+    # Re-probe without volume metrics (HEAD probes do not collect them)
+    db.insert_batch([sample_probe_result])
+
+    result = db.query(
+        "SELECT COUNT(*), MAX(quote_volume_usdt) FROM daily_availability WHERE symbol = ?",
+        [sample_probe_result["symbol"]],
+    )
+    assert result[0] == (1, None)
+
+
+def test_upsert_skips_unchanged_rows(db, sample_probe_result):
+    """Test re-probing identical content leaves the row untouched (probe_timestamp kept)."""
+    later = sample_probe_result["probe_timestamp"] + datetime.timedelta(days=1)
+    sql = "SELECT COUNT(*), MAX(probe_timestamp) FROM daily_availability"
+    db.insert_batch([sample_probe_result])
+    first = db.query(sql)
+
+    # Identical content, newer probe: the conflict guard skips the write
+    db.insert_batch([{**sample_probe_result, "probe_timestamp": later}])
+    unchanged = db.query(sql)
+
+    # Changed content: the row is updated, timestamp included
+    db.insert_batch([{**sample_probe_result, "file_size_bytes": 1, "probe_timestamp": later}])
+    changed = db.query(sql)
+
+    assert unchanged == first
+    assert changed[0][0] == 1
+    assert changed[0][1] > first[0][1]
+
+
+def test_upsert_skips_row_reprobed_through_another_path(db, sample_probe_result):
+    """Test a row written by insert_availability and re-probed via insert_batch is kept."""
+    # Non-UTC session: aware last_modified must compare equal across write paths
+    db.conn.execute("SET TimeZone = 'America/New_York'")
+    later = sample_probe_result["probe_timestamp"] + datetime.timedelta(days=1)
+
+    db.insert_availability(**sample_probe_result)
+    db.insert_batch([{**sample_probe_result, "probe_timestamp": later}])
+
+    assert db.query("SELECT probe_timestamp FROM daily_availability") == [
+        (sample_probe_result["probe_timestamp"].replace(tzinfo=None),)
+    ]
 
 
 def test_query_custom_sql(populated_db):
     """Test arbitrary SQL query execution."""
     result = populated_db.query(
         "SELECT symbol FROM daily_availability WHERE date = ? ORDER BY symbol",
-        [datetime.date(2024, 1, 15)],
+        [JAN15],
     )
 
     symbols = [row[0] for row in result]
@@ -64,19 +282,17 @@ def test_query_custom_sql(populated_db):
 
 def test_context_manager(temp_db_path):
     """Test AvailabilityDatabase as context manager."""
-    from binance_futures_availability.database.availability_db import AvailabilityDatabase
-
     with AvailabilityDatabase(db_path=temp_db_path) as db:
         # Insert record
         db.insert_availability(
-            date=datetime.date(2024, 1, 15),
+            date=JAN15,
             symbol="BTCUSDT",
             available=True,
             file_size_bytes=8421945,
             last_modified=None,
             url="https://example.com/file.zip",
             status_code=200,
-            probe_timestamp=datetime.datetime.now(datetime.UTC),
+            probe_timestamp=FIXED_TS,
         )
 
     # Connection should be closed after exiting context
@@ -89,3 +305,13 @@ def test_insert_batch_empty_list(db):
     # Verify no records inserted
     result = db.query("SELECT COUNT(*) FROM daily_availability")
     assert result[0][0] == 0
+
+
+def test_in_memory_database():
+    """Test ":memory:" opens a private database with the full schema, nothing on disk."""
+    with AvailabilityDatabase(db_path=":memory:") as db:
+        db.insert_batch_tuples([(JAN15, "BTCUSDT", True, 8000000, None, "", 200, FIXED_TS)])
+        assert db.query("SELECT COUNT(*) FROM daily_availability") == [(1,)]
+
+    with AvailabilityDatabase(db_path=":memory:") as db:
+        assert db.query("SELECT COUNT(*) FROM daily_availability") == [(0,)]
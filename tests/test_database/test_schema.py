@@ -1,12 +1,13 @@
 """Tests for database schema creation."""
 
+from binance_futures_availability.database.availability_db import ARROW_SCHEMA
 from binance_futures_availability.database.schema import create_schema
 
 
-def test_create_schema(db):
+def test_create_schema(schema_db):
     """Test schema creation creates table and indexes."""
-    # Schema already created by db fixture, verify it exists
-    result = db.conn.execute(
+    # Schema already created by schema_db fixture, verify it exists
+    result = schema_db.conn.execute(
         """
         SELECT name FROM sqlite_master
         WHERE type='table' AND name='daily_availability'
@@ -17,10 +18,16 @@ def test_create_schema(db):
     assert result[0] == "daily_availability"
 
 
-def test_schema_has_correct_columns(db):
+def test_schema_has_correct_columns(schema_db):
     """Test daily_availability table has all required columns."""
-    result = db.conn.execute("PRAGMA table_info(daily_availability)").fetchall()
-    column_names = [row[1] for row in result]
+    result = schema_db.conn.execute(
+        """
+        SELECT column_name FROM information_schema.columns
+        WHERE table_name = 'daily_availability'
+        ORDER BY ordinal_position
+        """
+    ).fetchall()
+    column_names = [row[0] for row in result]
 
     expected_columns = [
         # Original 8 columns
@@ -51,25 +58,53 @@ def test_schema_has_correct_columns(db):
     assert len(column_names) == 17, f"Expected 17 columns, got {len(column_names)}"
 
 
-def test_schema_has_primary_key(db):
+def test_arrow_schema_matches_table(schema_db):
+    """Test the write path's ARROW_SCHEMA mirrors the DDL column names, order and types."""
+    table_columns = schema_db.conn.execute(
+        """
+        SELECT column_name, data_type FROM information_schema.columns
+        WHERE table_name = 'daily_availability'
+        ORDER BY ordinal_position
+        """
+    ).fetchall()
+    schema_db.conn.register("_empty_batch", ARROW_SCHEMA.empty_table())
+    try:
+        arrow_columns = [
+            (name, data_type)
+            for name, data_type, *_ in schema_db.conn.execute(
+                "DESCRIBE SELECT * FROM _empty_batch"
+            ).fetchall()
+        ]
+    finally:
+        schema_db.conn.unregister("_empty_batch")
+
+    assert arrow_columns == table_columns
+
+
+def test_schema_has_primary_key(schema_db):
     """Test daily_availability has composite primary key (date, symbol)."""
-    result = db.conn.execute("PRAGMA table_info(daily_availability)").fetchall()
+    result = schema_db.conn.execute(
+        """
+        SELECT constraint_column_names FROM duckdb_constraints()
+        WHERE table_name = 'daily_availability' AND constraint_type = 'PRIMARY KEY'
+        """
+    ).fetchone()
 
     # Check primary key columns
-    pk_columns = [row[1] for row in result if row[5] > 0]  # row[5] is pk flag
+    pk_columns = result[0]
 
     assert "date" in pk_columns
     assert "symbol" in pk_columns
 
 
-def test_schema_idempotent(db):
+def test_schema_idempotent(schema_db):
     """Test create_schema can be called multiple times without error."""
     # Schema already created by fixture
-    create_schema(db.conn)  # Should not raise error
-    create_schema(db.conn)  # Second call should also work
+    create_schema(schema_db.conn)  # Should not raise error
+    create_schema(schema_db.conn)  # Second call should also work
 
     # Verify table still exists
-    result = db.conn.execute(
+    result = schema_db.conn.execute(
         """
         SELECT COUNT(*) FROM sqlite_master
         WHERE type='table' AND name='daily_availability'
@@ -79,10 +114,10 @@ def test_schema_idempotent(db):
     assert result[0] == 1  # Only one table (no duplicates)
 
 
-def test_schema_has_indexes(db):
+def test_schema_has_indexes(schema_db):
     """Test schema creates required indexes (ADR-0027 grow opportunity)."""
     # Query DuckDB system catalog for indexes
-    result = db.conn.execute(
+    result = schema_db.conn.execute(
         """
         SELECT index_name FROM duckdb_indexes()
         WHERE table_name = 'daily_availability'
@@ -8,7 +8,8 @@ import datetime
 
 import pytest
 
-from binance_futures_availability.probing.s3_vision import check_symbol_availability
+from binance_futures_availability.probing.batch_prober import BatchProber
+from binance_futures_availability.probing.s3_vision import HTTP_POOL, check_symbol_availability
 
 
 def test_check_symbol_availability_success(mock_urlopen_success):
@@ -23,6 +24,28 @@ def test_check_symbol_availability_success(mock_urlopen_success):
     assert result["url"].endswith("BTCUSDT-1m-2024-01-15.zip")
 
 
+def test_head_not_get(mock_urlopen_success):
+    """Test probe issues HEAD (headers only), never a GET that downloads the ZIP body."""
+    result = check_symbol_availability("BTCUSDT", datetime.date(2024, 1, 15))
+
+    method, url = mock_urlopen_success.call_args.args
+    assert method == "HEAD"
+    assert url == result["url"]
+
+
+def test_check_symbol_availability_missing_content_length(mocker, mock_s3_response):
+    """Test 200 without Content-Length reports unknown size (None), not 0."""
+    mocker.patch(
+        "binance_futures_availability.probing.s3_vision.HTTP_POOL.request",
+        return_value=mock_s3_response(200, {}),
+    )
+
+    result = check_symbol_availability("BTCUSDT", datetime.date(2024, 1, 15))
+
+    assert result["available"] is True
+    assert result["file_size_bytes"] is None
+
+
 def test_check_symbol_availability_404(mock_urlopen_404):
     """Test unavailable symbol (404 Not Found)."""
     result = check_symbol_availability("NEWCOINUSDT", datetime.date(2024, 1, 15))
@@ -40,6 +63,11 @@ def test_check_symbol_availability_network_error(mock_urlopen_network_error):
         check_symbol_availability("BTCUSDT", datetime.date(2024, 1, 15))
 
 
+def test_http_pool_keeps_a_connection_per_worker():
+    """Pool must retain one keep-alive connection per default worker (else TLS churn)."""
+    assert HTTP_POOL.connection_pool_kw["maxsize"] >= BatchProber().max_workers
+
+
 @pytest.mark.integration
 def test_check_symbol_availability_live_btcusdt():
     """Integration test: Probe BTCUSDT on 2024-01-15 (known available)."""
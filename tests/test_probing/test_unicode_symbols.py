@@ -12,36 +12,40 @@ Root cause: ASCII encoding error for newly discovered Chinese symbol
 """
 
 import datetime
-import urllib.error
-from unittest.mock import Mock, patch
+import urllib.parse
+from unittest.mock import patch
 
 import pytest
+import urllib3
 
 from binance_futures_availability.probing.s3_vision import check_symbol_availability
 
-# Mark entire module as integration - tests edge cases with live S3 API interactions
-pytestmark = pytest.mark.integration
+# ADR-0019: all probes go through the shared urllib3 pool
+HTTP_POOL_REQUEST = "binance_futures_availability.probing.s3_vision.HTTP_POOL.request"
+
+
+def _assert_encoded(symbol: str, url: str) -> None:
+    """Assert url carries symbol percent-encoded (urllib.parse.quote is the oracle)."""
+    assert urllib.parse.quote(symbol, safe="") in url
 
 
 class TestUnicodeSymbolHandling:
-    """Test probing symbols with non-ASCII characters."""
+    """Test probing symbols with non-ASCII characters (mocked S3, no network)."""
 
-    def test_chinese_symbol_url_encoding(self):
+    def test_chinese_symbol_url_encoding(self, mock_s3_response):
         """Chinese characters in symbol names should be properly URL-encoded."""
         symbol = "币安人生USDT"
         date = datetime.date(2024, 1, 15)
 
-        # Mock successful response
-        mock_response = Mock()
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_response.status = 200
-        mock_response.headers = {
-            "Content-Length": "8000000",
-            "Last-Modified": "Mon, 15 Jan 2024 02:00:00 GMT",
-        }
-
-        with patch("urllib.request.urlopen", return_value=mock_response) as mock_urlopen:
+        response = mock_s3_response(
+            200,
+            {
+                "Content-Length": "8000000",
+                "Last-Modified": "Mon, 15 Jan 2024 02:00:00 GMT",
+            },
+        )
+
+        with patch(HTTP_POOL_REQUEST, return_value=response) as mock_request:
             result = check_symbol_availability(symbol, date)
 
             # Verify result contains original symbol (not encoded)
@@ -49,63 +53,44 @@ class TestUnicodeSymbolHandling:
             assert result["available"] is True
 
             # Verify URL was properly percent-encoded
-            expected_encoded = "%E5%B8%81%E5%AE%89%E4%BA%BA%E7%94%9FUSDT"
-            assert expected_encoded in result["url"]
+            _assert_encoded(symbol, result["url"])
 
-            # Verify urlopen was called (encoding worked, no ASCII error)
-            assert mock_urlopen.called
+            # Verify the request was sent (encoding worked, no ASCII error)
+            assert mock_request.called
 
-    def test_emoji_symbol_url_encoding(self):
+    def test_emoji_symbol_url_encoding(self, mock_s3_response):
         """Emoji characters in symbol names should be properly URL-encoded."""
         symbol = "🚀USDT"
         date = datetime.date(2024, 1, 15)
 
-        mock_response = Mock()
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_response.status = 200
-        mock_response.headers = {"Content-Length": "8000000"}
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch(HTTP_POOL_REQUEST, return_value=mock_s3_response(200)):
             result = check_symbol_availability(symbol, date)
 
             assert result["symbol"] == "🚀USDT"
             assert result["available"] is True
-            # Emoji rocket: U+1F680 → %F0%9F%9A%80
-            assert "%F0%9F%9A%80" in result["url"]
+            # Emoji rocket: U+1F680 → 4-byte UTF-8 sequence, each byte encoded
+            _assert_encoded(symbol, result["url"])
 
-    def test_mixed_unicode_symbol(self):
+    def test_mixed_unicode_symbol(self, mock_s3_response):
         """Symbols with mixed ASCII and Unicode should encode only non-ASCII parts."""
         symbol = "TEST币安USDT"
         date = datetime.date(2024, 1, 15)
 
-        mock_response = Mock()
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_response.status = 200
-        mock_response.headers = {"Content-Length": "8000000"}
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch(HTTP_POOL_REQUEST, return_value=mock_s3_response(200)):
             result = check_symbol_availability(symbol, date)
 
             assert result["symbol"] == "TEST币安USDT"
             # ASCII parts stay as-is, Unicode parts encoded
             assert "TEST" in result["url"]
             assert "USDT" in result["url"]
-            assert "%E5%B8%81%E5%AE%89" in result["url"]  # 币安 encoded
+            _assert_encoded(symbol, result["url"])
 
-    def test_ascii_symbol_unchanged(self):
+    def test_ascii_symbol_unchanged(self, mock_s3_response):
         """Regular ASCII symbols should work without encoding changes."""
         symbol = "BTCUSDT"
         date = datetime.date(2024, 1, 15)
 
-        mock_response = Mock()
-        mock_response.__enter__ = Mock(return_value=mock_response)
-        mock_response.__exit__ = Mock(return_value=False)
-        mock_response.status = 200
-        mock_response.headers = {"Content-Length": "8000000"}
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch(HTTP_POOL_REQUEST, return_value=mock_s3_response(200)):
             result = check_symbol_availability(symbol, date)
 
             assert result["symbol"] == "BTCUSDT"
@@ -113,21 +98,12 @@ class TestUnicodeSymbolHandling:
             assert "BTCUSDT" in result["url"]
             assert "%" not in result["url"]  # No percent-encoding for ASCII
 
-    def test_unicode_symbol_404_handling(self):
+    def test_unicode_symbol_404_handling(self, mock_s3_response):
         """404 responses should work correctly for Unicode symbols."""
         symbol = "币安人生USDT"
         date = datetime.date(2024, 1, 15)
 
-        # Mock 404 response
-        http_error = urllib.error.HTTPError(
-            url="https://example.com",
-            code=404,
-            msg="Not Found",
-            hdrs={},
-            fp=None,
-        )
-
-        with patch("urllib.request.urlopen", side_effect=http_error):
+        with patch(HTTP_POOL_REQUEST, return_value=mock_s3_response(404, {})):
             result = check_symbol_availability(symbol, date)
 
             assert result["symbol"] == "币安人生USDT"
@@ -140,9 +116,9 @@ class TestUnicodeSymbolHandling:
         symbol = "币安人生USDT"
         date = datetime.date(2024, 1, 15)
 
-        url_error = urllib.error.URLError("Network timeout")
+        network_error = urllib3.exceptions.HTTPError("Network timeout")
 
-        with patch("urllib.request.urlopen", side_effect=url_error):
+        with patch(HTTP_POOL_REQUEST, side_effect=network_error):
             with pytest.raises(RuntimeError, match="Network error probing 币安人生USDT"):
                 check_symbol_availability(symbol, date)
 
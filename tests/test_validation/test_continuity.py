@@ -1,77 +1,60 @@
 """Tests for continuity validation."""
 
-import datetime
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from conftest import FIXED_TS, JAN15, JAN16, JAN17, JAN18, JAN19
 
 from binance_futures_availability.validation.continuity import ContinuityValidator
 
 
-def test_check_continuity_no_gaps(populated_db, temp_db_path):
-    """Test continuity check with complete coverage (no gaps)."""
-    validator = ContinuityValidator(db_path=temp_db_path)
+@pytest.fixture(scope="module")
+def validator(populated_db_path: Path) -> Iterator[ContinuityValidator]:
+    """One ContinuityValidator over the seeded session database, shared by this module."""
+    with ContinuityValidator(db_path=populated_db_path) as v:
+        yield v
 
+
+def test_check_continuity_no_gaps(validator):
+    """Test continuity check with complete coverage (no gaps)."""
     # Check only the range we populated (2024-01-15 to 2024-01-17)
-    missing_dates = validator.check_continuity(
-        start_date=datetime.date(2024, 1, 15), end_date=datetime.date(2024, 1, 17)
-    )
+    missing_dates = validator.check_continuity(start_date=JAN15, end_date=JAN17)
 
     assert len(missing_dates) == 0
 
-    validator.close()
-
 
 def test_check_continuity_with_gap(db, temp_db_path):
     """Test continuity check detects missing date."""
-    # Insert only 2024-01-15 and 2024-01-17 (missing 2024-01-16)
-    db.insert_availability(
-        date=datetime.date(2024, 1, 15),
-        symbol="BTCUSDT",
-        available=True,
-        file_size_bytes=8000000,
-        last_modified=None,
-        url="https://example.com/file.zip",
-        status_code=200,
-        probe_timestamp=datetime.datetime.now(datetime.UTC),
-    )
-
-    db.insert_availability(
-        date=datetime.date(2024, 1, 17),
-        symbol="BTCUSDT",
-        available=True,
-        file_size_bytes=8000000,
-        last_modified=None,
-        url="https://example.com/file.zip",
-        status_code=200,
-        probe_timestamp=datetime.datetime.now(datetime.UTC),
+    # Insert only 2024-01-15 and 2024-01-17 (missing 2024-01-16), in one batch
+    url = "https://example.com/file.zip"
+    db.insert_batch_tuples(
+        [
+            (JAN15, "BTCUSDT", True, 8000000, None, url, 200, FIXED_TS),
+            (JAN17, "BTCUSDT", True, 8000000, None, url, 200, FIXED_TS),
+        ]
     )
 
     validator = ContinuityValidator(db_path=temp_db_path)
-    missing_dates = validator.check_continuity(
-        start_date=datetime.date(2024, 1, 15), end_date=datetime.date(2024, 1, 17)
-    )
+    missing_dates = validator.check_continuity(start_date=JAN15, end_date=JAN17)
 
     assert len(missing_dates) == 1
-    assert datetime.date(2024, 1, 16) in missing_dates
+    assert JAN16 in missing_dates
 
     validator.close()
 
 
-def test_validate_continuity(populated_db, temp_db_path):
+def test_validate_continuity(validator):
     """Test validate_continuity returns boolean."""
-    validator = ContinuityValidator(db_path=temp_db_path)
-
-    result = validator.validate_continuity(
-        start_date=datetime.date(2024, 1, 15), end_date=datetime.date(2024, 1, 17)
-    )
+    result = validator.validate_continuity(start_date=JAN15, end_date=JAN17)
 
     assert result is True
 
-    validator.close()
-
 
 def test_check_continuity_multiple_gaps(db, temp_db_path):
     """Test continuity check detects multiple non-consecutive missing dates (ADR-0027)."""
     # Insert dates with gaps: 2024-01-15, 2024-01-17, 2024-01-19 (missing 16, 18)
-    for date in [datetime.date(2024, 1, 15), datetime.date(2024, 1, 17), datetime.date(2024, 1, 19)]:
+    for date in [JAN15, JAN17, JAN19]:
         db.insert_availability(
             date=date,
             symbol="BTCUSDT",
@@ -80,29 +63,21 @@ def test_check_continuity_multiple_gaps(db, temp_db_path):
             last_modified=None,
             url="https://example.com/file.zip",
             status_code=200,
-            probe_timestamp=datetime.datetime.now(datetime.UTC),
+            probe_timestamp=FIXED_TS,
         )
 
     validator = ContinuityValidator(db_path=temp_db_path)
-    missing_dates = validator.check_continuity(
-        start_date=datetime.date(2024, 1, 15), end_date=datetime.date(2024, 1, 19)
-    )
+    missing_dates = validator.check_continuity(start_date=JAN15, end_date=JAN19)
 
     assert len(missing_dates) == 2
-    assert datetime.date(2024, 1, 16) in missing_dates
-    assert datetime.date(2024, 1, 18) in missing_dates
+    assert JAN16 in missing_dates
+    assert JAN18 in missing_dates
 
     validator.close()
 
 
-def test_check_continuity_single_day_range(populated_db, temp_db_path):
+def test_check_continuity_single_day_range(validator):
     """Test continuity check with single day range (start_date == end_date) (ADR-0027)."""
-    validator = ContinuityValidator(db_path=temp_db_path)
-
-    missing_dates = validator.check_continuity(
-        start_date=datetime.date(2024, 1, 15), end_date=datetime.date(2024, 1, 15)
-    )
+    missing_dates = validator.check_continuity(start_date=JAN15, end_date=JAN15)
 
     assert len(missing_dates) == 0
-
-    validator.close()
@@ -11,14 +11,16 @@ See: docs/architecture/decisions/0013-volume-rankings-timeseries.md
 """
 
 import datetime
+import functools
 
 # Import functions from the script we're testing
 import sys
-import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import duckdb
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import pytest
 
@@ -41,42 +43,37 @@ pytestmark = pytest.mark.integration
 # ============================================================================
 
 
-@pytest.fixture
-def temp_db() -> Path:
-    """Create temporary DuckDB database with daily_availability table."""
-    temp_path = Path(tempfile.mktemp(suffix=".duckdb"))
-
-    conn = duckdb.connect(str(temp_path))
-
-    # Create schema matching availability database
-    conn.execute("""
-        CREATE TABLE daily_availability (
-            date DATE NOT NULL,
-            symbol VARCHAR NOT NULL,
-            available BOOLEAN NOT NULL,
-            quote_volume_usdt DOUBLE,
-            trade_count BIGINT,
-            file_size_bytes BIGINT,
-            last_modified TIMESTAMP,
-            url VARCHAR NOT NULL,
-            status_code INTEGER NOT NULL,
-            probe_timestamp TIMESTAMP NOT NULL,
-            PRIMARY KEY (date, symbol)
-        )
-    """)
-
-    conn.close()
-
-    yield temp_path
-
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+# First two sample dates (also the dict keys into rankings_by_date)
+_DAY1 = datetime.date(2024, 1, 15)
+_DAY2 = datetime.date(2024, 1, 16)
+
+# Fixed last_modified / probe_timestamp for seeded rows: deterministic, no per-row clock
+_FIXED_TS = datetime.datetime(2024, 1, 20, 2, 0, 0, tzinfo=datetime.UTC)
+
+# Split point for date-column kernels, built once as an Arrow scalar
+_SPLIT_DATE = pa.scalar(datetime.date(2024, 1, 17), type=pa.date32())
+
+# Schema matching availability database (rankings-relevant subset)
+DAILY_AVAILABILITY_DDL = """
+    CREATE TABLE daily_availability (
+        date DATE NOT NULL,
+        symbol VARCHAR NOT NULL,
+        available BOOLEAN NOT NULL,
+        quote_volume_usdt DOUBLE,
+        trade_count BIGINT,
+        file_size_bytes BIGINT,
+        last_modified TIMESTAMP,
+        url VARCHAR NOT NULL,
+        status_code INTEGER NOT NULL,
+        probe_timestamp TIMESTAMP NOT NULL,
+        PRIMARY KEY (date, symbol)
+    )
+"""
 
 
-@pytest.fixture
-def populated_db(temp_db: Path) -> Path:
-    """Database with sample data for ranking tests.
+@pytest.fixture(scope="session")
+def session_populated_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample ranking data, built once per session (read-only; do not write).
 
     Creates 5 days × 5 symbols with varying volumes:
         - BTCUSDT: Rank 1 (highest volume)
@@ -85,8 +82,6 @@ def populated_db(temp_db: Path) -> Path:
         - BNBUSDT: Rank 4
         - ADAUSDT: Rank 5 (lowest volume)
     """
-    conn = duckdb.connect(str(temp_db))
-
     symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "ADAUSDT"]
     base_volumes = {
         "BTCUSDT": 1_000_000_000,  # Rank 1
@@ -96,37 +91,70 @@ def populated_db(temp_db: Path) -> Path:
         "ADAUSDT": 10_000_000,  # Rank 5
     }
 
-    # Create 5 days of data
+    # Create 5 days of data, varying volume slightly per day to simulate rank changes
+    rows = []
     for day_offset in range(5):
-        date = datetime.date(2024, 1, 15) + datetime.timedelta(days=day_offset)
-
+        date = _DAY1 + datetime.timedelta(days=day_offset)
+        volume_multiplier = 1.0 + (day_offset * 0.01)  # 1%, 2%, 3%, 4%, 5% daily growth
         for symbol in symbols:
-            # Vary volume slightly per day to simulate rank changes
-            volume_multiplier = 1.0 + (day_offset * 0.01)  # 1%, 2%, 3%, 4%, 5% daily growth
             volume = base_volumes[symbol] * volume_multiplier
+            rows.append((date, symbol, volume, int(volume / 1000), _FIXED_TS, _FIXED_TS))
+
+    # One multi-row VALUES statement: parsed and planned once instead of per row
+    row_sql = "(?, ?, true, ?, ?, 8000000, ?, 'https://example.com/file.zip', 200, ?)"
+    path = tmp_path_factory.mktemp("rankings") / "populated.duckdb"
+    with duckdb.connect(str(path)) as conn:
+        conn.execute(DAILY_AVAILABILITY_DDL)
+        conn.execute(
+            f"INSERT INTO daily_availability VALUES {', '.join([row_sql] * len(rows))}",
+            [value for row in rows for value in row],
+        )
+    return path
+
 
-            conn.execute(
-                """
-                INSERT INTO daily_availability VALUES (
-                    ?, ?, true, ?, ?,
-                    8000000, CURRENT_TIMESTAMP,
-                    'https://example.com/file.zip', 200, CURRENT_TIMESTAMP
-                )
-            """,
-                [date, symbol, volume, int(volume / 1000)],
-            )
+@pytest.fixture
+def memory_db() -> Iterator[duckdb.DuckDBPyConnection]:
+    """Empty in-memory daily_availability database (no file, no WAL)."""
+    with duckdb.connect(":memory:") as conn:
+        conn.execute(DAILY_AVAILABILITY_DDL)
+        yield conn
+
+
+@functools.cache
+def _query_rankings_cached(db_path: str, start_date: str | None, mtime_ns: int) -> pa.Table:
+    return query_rankings(Path(db_path), start_date=start_date, logger=None)
+
+
+def cached_query_rankings(db_path: Path, start_date: str | None = None) -> pa.Table:
+    """query_rankings memoized per (path, start_date, mtime); returned tables are shared."""
+    return _query_rankings_cached(str(db_path), start_date, db_path.stat().st_mtime_ns)
+
+
+@pytest.fixture(scope="session")
+def rankings_table(session_populated_db: Path) -> pa.Table:
+    """Rankings for the sample database, queried once per session (read-only)."""
+    return cached_query_rankings(session_populated_db)
 
-    conn.close()
-    return temp_db
+
+@pytest.fixture(scope="session")
+def rankings_by_date(rankings_table: pa.Table) -> dict[datetime.date, pa.Table]:
+    """Per-date slices of rankings_table, so tests look up a date instead of filtering."""
+    dates = rankings_table["date"]
+    return {date.as_py(): rankings_table.filter(pc.equal(dates, date)) for date in pc.unique(dates)}
+
+
+@pytest.fixture(scope="session")
+def rankings_parquet(tmp_path_factory: pytest.TempPathFactory, rankings_table: pa.Table) -> Path:
+    """rankings_table written once per session via write_parquet (copy before writing)."""
+    path = tmp_path_factory.mktemp("rankings") / "rankings.parquet"
+    write_parquet(rankings_table, path, logger=None)
+    return path
 
 
 @pytest.fixture
-def temp_parquet() -> Path:
-    """Create temporary Parquet file path."""
-    temp_path = Path(tempfile.mktemp(suffix=".parquet"))
-    yield temp_path
-    if temp_path.exists():
-        temp_path.unlink()
+def temp_parquet(tmp_path: Path) -> Path:
+    """Temporary Parquet file path under the per-test tmp_path (not created)."""
+    return tmp_path / "rankings.parquet"
 
 
 # ============================================================================
@@ -173,10 +201,10 @@ def test_schema_definition():
     assert RANKINGS_SCHEMA.field("generation_timestamp").type == pa.timestamp("us")
 
 
-def test_validate_rankings_table_valid(populated_db: Path, temp_parquet: Path):
+def test_validate_rankings_table_valid(session_populated_db: Path):
     """Test validation passes for correctly generated rankings table."""
     # Generate rankings
-    table = query_rankings(populated_db, start_date=None, logger=None)
+    table = cached_query_rankings(session_populated_db)
 
     # Should not raise
     validate_rankings_table(table, logger=None)
@@ -195,7 +223,7 @@ def test_validate_rankings_table_schema_mismatch():
 
     wrong_table = pa.table(
         {
-            "date": [datetime.date(2024, 1, 15)],
+            "date": [_DAY1],
             "symbol": ["BTCUSDT"],
             "rank": [1],
         },
@@ -208,7 +236,7 @@ def test_validate_rankings_table_schema_mismatch():
 
 def test_validate_rankings_table_empty():
     """Test validation fails for empty table."""
-    empty_table = pa.table({col.name: [] for col in RANKINGS_SCHEMA}, schema=RANKINGS_SCHEMA)
+    empty_table = RANKINGS_SCHEMA.empty_table()
 
     with pytest.raises(ValueError, match="Rankings table is empty"):
         validate_rankings_table(empty_table, logger=None)
@@ -218,7 +246,7 @@ def test_validate_rankings_table_invalid_ranks():
     """Test validation fails when ranks are NULL or <1."""
     # Create table with NULL ranks
     data = {
-        "date": [datetime.date(2024, 1, 15)],
+        "date": [_DAY1],
         "symbol": ["BTCUSDT"],
         "rank": [None],  # Invalid NULL rank
         "quote_volume_usdt": [1000000.0],
@@ -244,20 +272,15 @@ def test_validate_rankings_table_invalid_ranks():
 # ============================================================================
 
 
-def test_ranking_calculation_order(populated_db: Path):
+def test_ranking_calculation_order(rankings_by_date: dict):
     """Test rankings are ordered by quote_volume_usdt DESC."""
-    table = query_rankings(populated_db, start_date=None, logger=None)
-
     # Check first date's rankings
-    first_date_data = table.filter(
-        pa.compute.equal(table["date"], datetime.date(2024, 1, 15))
-    ).to_pydict()
+    first_date = rankings_by_date[_DAY1]
 
     # Verify order: BTCUSDT (1), ETHUSDT (2), SOLUSDT (3), BNBUSDT (4), ADAUSDT (5)
     expected_order = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "ADAUSDT"]
-    actual_symbols = [
-        s for _, s in sorted(zip(first_date_data["rank"], first_date_data["symbol"], strict=False))
-    ]
+    by_rank = pc.sort_indices(first_date, sort_keys=[("rank", "ascending")])
+    actual_symbols = first_date["symbol"].take(by_rank).to_pylist()
 
     assert actual_symbols == expected_order, "Rankings should be ordered by volume DESC"
 
@@ -272,30 +295,20 @@ def test_dense_rank_no_gaps():
     assert "RANK()" not in sql or "DENSE_RANK()" in sql, "Should not use RANK without DENSE_"
 
 
-def test_rank_change_calculation(populated_db: Path):
+def test_rank_change_calculation(rankings_by_date: dict):
     """Test rank change windows (1d, 7d, 14d, 30d) are calculated correctly."""
-    table = query_rankings(populated_db, start_date=None, logger=None)
-
     # Day 2: Check 1-day rank change (should be 0 for all, since relative order unchanged)
-    day2_data = table.filter(
-        pa.compute.equal(table["date"], datetime.date(2024, 1, 16))
-    ).to_pydict()
+    rank_change_1d = rankings_by_date[_DAY2]["rank_change_1d"]
 
     # All symbols maintain same rank (volumes grew proportionally)
-    for rank_change in day2_data["rank_change_1d"]:
-        assert rank_change is None or rank_change == 0, (
-            "Rank change should be 0 when relative order unchanged"
-        )
+    unchanged = pc.or_kleene(pc.is_null(rank_change_1d), pc.equal(rank_change_1d, 0))
+    assert pc.all(unchanged).as_py(), "Rank change should be 0 when relative order unchanged"
 
 
-def test_rank_change_null_for_insufficient_history(populated_db: Path):
+def test_rank_change_null_for_insufficient_history(rankings_by_date: dict):
     """Test rank_change_7d/14d/30d are NULL when insufficient history."""
-    table = query_rankings(populated_db, start_date=None, logger=None)
-
     # Day 1: No prior history, all rank changes should be NULL
-    day1_data = table.filter(
-        pa.compute.equal(table["date"], datetime.date(2024, 1, 15))
-    ).to_pydict()
+    day1_data = rankings_by_date[_DAY1].to_pydict()
 
     # All rank changes should be NULL on first day
     for rank_change in day1_data["rank_change_1d"]:
@@ -305,42 +318,25 @@ def test_rank_change_null_for_insufficient_history(populated_db: Path):
         assert rank_change is None, "rank_change_7d should be NULL with <7 days history"
 
 
-def test_percentile_calculation(populated_db: Path):
+def test_percentile_calculation(rankings_by_date: dict):
     """Test percentile rank calculation (0-100, 0=top)."""
-    table = query_rankings(populated_db, start_date=None, logger=None)
-
     # Check first date
-    day1_data = table.filter(
-        pa.compute.equal(table["date"], datetime.date(2024, 1, 15))
-    ).to_pydict()
+    day1 = rankings_by_date[_DAY1]
+
+    def percentile_of(symbol: str) -> float:
+        return day1["percentile"].filter(pc.equal(day1["symbol"], symbol))[0].as_py()
 
     # Top rank (BTCUSDT) should have percentile ~0
-    btc_percentile = [
-        p
-        for s, p in zip(day1_data["symbol"], day1_data["percentile"], strict=False)
-        if s == "BTCUSDT"
-    ][0]
-    assert btc_percentile < 25, "Top symbol should have low percentile"
+    assert percentile_of("BTCUSDT") < 25, "Top symbol should have low percentile"
 
     # Bottom rank (ADAUSDT) should have percentile ~100
-    ada_percentile = [
-        p
-        for s, p in zip(day1_data["symbol"], day1_data["percentile"], strict=False)
-        if s == "ADAUSDT"
-    ][0]
-    assert ada_percentile > 75, "Bottom symbol should have high percentile"
+    assert percentile_of("ADAUSDT") > 75, "Bottom symbol should have high percentile"
 
 
-def test_market_share_calculation(populated_db: Path):
+def test_market_share_calculation(rankings_by_date: dict):
     """Test market_share_pct sums to ~100% per date."""
-    table = query_rankings(populated_db, start_date=None, logger=None)
-
     # Check first date
-    day1_data = table.filter(
-        pa.compute.equal(table["date"], datetime.date(2024, 1, 15))
-    ).to_pydict()
-
-    total_market_share = sum(day1_data["market_share_pct"])
+    total_market_share = pc.sum(rankings_by_date[_DAY1]["market_share_pct"]).as_py()
 
     assert 99.9 < total_market_share < 100.1, "Market share should sum to ~100% per date"
 
@@ -350,17 +346,34 @@ def test_market_share_calculation(populated_db: Path):
 # ============================================================================
 
 
-def test_get_latest_date_from_parquet(populated_db: Path, temp_parquet: Path):
+def test_get_latest_date_from_parquet(rankings_parquet: Path, mocker):
     """Test extracting latest date from existing Parquet file."""
-    # Generate initial rankings
-    table = query_rankings(populated_db, start_date=None, logger=None)
-    write_parquet(table, temp_parquet, logger=None)
+    read_table = mocker.spy(pq, "read_table")
 
-    # Extract latest date
-    latest_date = get_latest_date_from_parquet(temp_parquet)
+    latest_date = get_latest_date_from_parquet(rankings_parquet)
 
     assert latest_date == "2024-01-19", "Should extract latest date from Parquet"
 
+    # Answered from footer statistics: no data pages scanned
+    read_table.assert_not_called()
+
+    metadata = pq.read_metadata(rankings_parquet)
+    date_index = RANKINGS_SCHEMA.get_field_index("date")
+    stats_max = max(
+        metadata.row_group(i).column(date_index).statistics.max
+        for i in range(metadata.num_row_groups)
+    )
+    assert latest_date == stats_max.isoformat(), "Should match footer statistics max"
+
+
+def test_get_latest_date_without_statistics(rankings_table: pa.Table, temp_parquet: Path):
+    """Test falls back to scanning the date column when footer statistics are absent."""
+    pq.write_table(rankings_table, temp_parquet, write_statistics=False)
+
+    latest_date = get_latest_date_from_parquet(temp_parquet)
+
+    assert latest_date == "2024-01-19", "Should extract latest date without statistics"
+
 
 def test_get_latest_date_nonexistent_file():
     """Test returns None for non-existent Parquet file."""
@@ -371,17 +384,15 @@ def test_get_latest_date_nonexistent_file():
     assert latest_date is None, "Should return None for missing file"
 
 
-def test_merge_tables_no_overlap(populated_db: Path, temp_parquet: Path):
+def test_merge_tables_no_overlap(session_populated_db: Path):
     """Test merging tables with no duplicate dates."""
     # Create two non-overlapping tables
-    table1 = query_rankings(populated_db, start_date=None, logger=None)
+    table1 = cached_query_rankings(session_populated_db)
 
     # Simulate new data by filtering to later dates
-    table1_subset = table1.filter(pa.compute.less(table1["date"], datetime.date(2024, 1, 17)))
+    table1_subset = table1.filter(pc.less(table1["date"], _SPLIT_DATE))
 
-    table2_subset = table1.filter(
-        pa.compute.greater_equal(table1["date"], datetime.date(2024, 1, 17))
-    )
+    table2_subset = table1.filter(pc.greater_equal(table1["date"], _SPLIT_DATE))
 
     # Merge should succeed
     merged = merge_tables(table1_subset, table2_subset, logger=None)
@@ -393,7 +404,7 @@ def test_merge_tables_with_overlap_raises():
     """Test merging tables with duplicate dates raises ValueError."""
     # Create overlapping tables
     data = {
-        "date": [datetime.date(2024, 1, 15)],
+        "date": [_DAY1],
         "symbol": ["BTCUSDT"],
         "rank": [1],
         "quote_volume_usdt": [1000000.0],
@@ -415,20 +426,19 @@ def test_merge_tables_with_overlap_raises():
         merge_tables(table1, table2, logger=None)
 
 
-def test_incremental_append_query(populated_db: Path):
+def test_incremental_append_query(session_populated_db: Path):
     """Test SQL query with start_date filters correctly."""
     # Query all data
-    full_table = query_rankings(populated_db, start_date=None, logger=None)
+    full_table = cached_query_rankings(session_populated_db)
 
     # Query only dates > 2024-01-16
-    incremental_table = query_rankings(populated_db, start_date="2024-01-16", logger=None)
+    incremental_table = cached_query_rankings(session_populated_db, start_date="2024-01-16")
 
     # Should have fewer rows (3 days instead of 5)
     assert len(incremental_table) < len(full_table), "Incremental query should return fewer rows"
 
-    # Verify no dates <= 2024-01-16
-    dates = incremental_table["date"].to_pylist()
-    assert all(d > datetime.date(2024, 1, 16) for d in dates), (
+    # Verify no dates <= 2024-01-16 (one min kernel, no per-row date objects)
+    assert pc.min(incremental_table["date"]).as_py() > _DAY2, (
         "Incremental table should only have dates > start_date"
     )
 
@@ -438,29 +448,26 @@ def test_incremental_append_query(populated_db: Path):
 # ============================================================================
 
 
-def test_empty_database_raises(temp_db: Path):
+def test_empty_database_raises(memory_db: duckdb.DuckDBPyConnection):
     """Test querying empty database raises error."""
-    # temp_db has no data
+    # memory_db has no data
 
     with pytest.raises(RuntimeError, match="Rankings query failed"):
-        query_rankings(temp_db, start_date=None, logger=None)
+        query_rankings(memory_db, start_date=None, logger=None)
 
 
-def test_single_symbol_ranking(temp_db: Path):
+def test_single_symbol_ranking(memory_db: duckdb.DuckDBPyConnection):
     """Test ranking with single symbol works correctly."""
-    conn = duckdb.connect(str(temp_db))
-
     # Insert single symbol
-    conn.execute("""
+    memory_db.execute("""
         INSERT INTO daily_availability VALUES (
             '2024-01-15', 'BTCUSDT', true, 1000000.0, 10000,
             8000000, CURRENT_TIMESTAMP,
             'https://example.com/file.zip', 200, CURRENT_TIMESTAMP
         )
     """)
-    conn.close()
 
-    table = query_rankings(temp_db, start_date=None, logger=None)
+    table = query_rankings(memory_db, start_date=None, logger=None)
 
     assert len(table) == 1, "Should handle single symbol correctly"
     assert table["rank"][0].as_py() == 1, "Single symbol should have rank 1"
@@ -470,13 +477,11 @@ def test_single_symbol_ranking(temp_db: Path):
     )
 
 
-def test_tied_volumes_same_rank(temp_db: Path):
+def test_tied_volumes_same_rank(memory_db: duckdb.DuckDBPyConnection):
     """Test symbols with identical volumes get same rank (DENSE_RANK behavior)."""
-    conn = duckdb.connect(str(temp_db))
-
     # Insert two symbols with identical volumes
     identical_volume = 1000000.0
-    conn.execute(
+    memory_db.execute(
         """
         INSERT INTO daily_availability VALUES
             ('2024-01-15', 'SYM1USDT', true, ?, 10000, 8000000, CURRENT_TIMESTAMP, 'https://example.com/file.zip', 200, CURRENT_TIMESTAMP),
@@ -485,9 +490,8 @@ def test_tied_volumes_same_rank(temp_db: Path):
     """,
         [identical_volume, identical_volume],
     )
-    conn.close()
 
-    table = query_rankings(temp_db, start_date=None, logger=None)
+    table = query_rankings(memory_db, start_date=None, logger=None)
     data = table.to_pydict()
 
     # Both tied symbols should have rank 1
@@ -505,37 +509,31 @@ def test_tied_volumes_same_rank(temp_db: Path):
     assert third_rank == 2, "DENSE_RANK should not create gaps after ties"
 
 
-def test_inactive_symbols_excluded(temp_db: Path):
+def test_inactive_symbols_excluded(memory_db: duckdb.DuckDBPyConnection):
     """Test symbols with available=FALSE are excluded from rankings."""
-    conn = duckdb.connect(str(temp_db))
-
     # Insert one active and one inactive symbol
-    conn.execute("""
+    memory_db.execute("""
         INSERT INTO daily_availability VALUES
             ('2024-01-15', 'ACTIVEUSDT', true, 1000000.0, 10000, 8000000, CURRENT_TIMESTAMP, 'https://example.com/file.zip', 200, CURRENT_TIMESTAMP),
             ('2024-01-15', 'INACTIVEUSDT', false, NULL, NULL, NULL, NULL, 'https://example.com/file.zip', 404, CURRENT_TIMESTAMP)
     """)
-    conn.close()
 
-    table = query_rankings(temp_db, start_date=None, logger=None)
+    table = query_rankings(memory_db, start_date=None, logger=None)
     symbols = table["symbol"].to_pylist()
 
     assert "ACTIVEUSDT" in symbols, "Active symbol should be included"
     assert "INACTIVEUSDT" not in symbols, "Inactive symbol should be excluded"
 
 
-def test_null_volume_excluded(temp_db: Path):
+def test_null_volume_excluded(memory_db: duckdb.DuckDBPyConnection):
     """Test symbols with NULL quote_volume_usdt are excluded."""
-    conn = duckdb.connect(str(temp_db))
-
     # Insert symbol with NULL volume
-    conn.execute("""
+    memory_db.execute("""
         INSERT INTO daily_availability VALUES
             ('2024-01-15', 'NULLVOLUMEUSDT', true, NULL, 10000, 8000000, CURRENT_TIMESTAMP, 'https://example.com/file.zip', 200, CURRENT_TIMESTAMP)
     """)
-    conn.close()
 
-    table = query_rankings(temp_db, start_date=None, logger=None)
+    table = query_rankings(memory_db, start_date=None, logger=None)
 
     assert len(table) == 0, "Symbols with NULL volume should be excluded"
 
@@ -545,43 +543,25 @@ def test_null_volume_excluded(temp_db: Path):
 # ============================================================================
 
 
-def test_write_parquet_creates_file(populated_db: Path, temp_parquet: Path):
+def test_write_parquet_creates_file(rankings_parquet: Path):
     """Test Parquet file is created with correct format."""
-    table = query_rankings(populated_db, start_date=None, logger=None)
-
-    write_parquet(table, temp_parquet, logger=None)
-
-    assert temp_parquet.exists(), "Parquet file should be created"
-    assert temp_parquet.stat().st_size > 0, "Parquet file should not be empty"
+    assert rankings_parquet.exists(), "Parquet file should be created"
+    assert rankings_parquet.stat().st_size > 0, "Parquet file should not be empty"
 
 
-def test_parquet_schema_preserved(populated_db: Path, temp_parquet: Path):
+def test_parquet_schema_preserved(rankings_parquet: Path):
     """Test schema is preserved after write/read cycle."""
-    table = query_rankings(populated_db, start_date=None, logger=None)
-    write_parquet(table, temp_parquet, logger=None)
+    # Footer-only read: no row groups are decoded
+    read_schema = pq.read_schema(rankings_parquet)
 
-    # Read back
-    read_table = pq.read_table(temp_parquet)
+    assert read_schema.equals(RANKINGS_SCHEMA), "Schema should be preserved after write/read"
 
-    assert read_table.schema.equals(RANKINGS_SCHEMA), "Schema should be preserved after write/read"
 
-
-def test_parquet_data_integrity(populated_db: Path, temp_parquet: Path):
+def test_parquet_data_integrity(rankings_table: pa.Table, rankings_parquet: Path):
     """Test data is preserved after write/read cycle."""
-    original_table = query_rankings(populated_db, start_date=None, logger=None)
-    write_parquet(original_table, temp_parquet, logger=None)
-
-    # Read back
-    read_table = pq.read_table(temp_parquet)
-
-    assert len(read_table) == len(original_table), "Row count should match"
+    read_table = pq.read_table(rankings_parquet)
 
-    # Compare data (convert to dict for easier comparison)
-    original_dict = original_table.to_pydict()
-    read_dict = read_table.to_pydict()
+    assert len(read_table) == len(rankings_table), "Row count should match"
 
-    for col in RANKINGS_SCHEMA.names:
-        if col != "generation_timestamp":  # Timestamps may have precision differences
-            assert original_dict[col] == read_dict[col], (
-                f"Column {col} data should match after write/read"
-            )
+    # Compare column buffers in Arrow (timestamp[us] round-trips exactly, so every column)
+    assert read_table.equals(rankings_table), "Data should match after write/read"